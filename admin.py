@@ -0,0 +1,58 @@
+import hmac
+import os
+import streamlit as st
+from metrics import REGISTRY, METRICS_PATH
+
+# Staff sections stay hidden unless a key is configured for the deployment
+ADMIN_KEY = os.environ.get("QUIZLEARN_ADMIN_KEY", "")
+INSTRUCTOR_KEY = os.environ.get("QUIZLEARN_INSTRUCTOR_KEY", "")
+
+def _matches(entered, key):
+    return bool(key) and hmac.compare_digest(entered.encode("utf-8"), key.encode("utf-8"))
+
+def staff_role():
+    """Sidebar key field; "admin", "instructor" or None depending on which configured key was entered."""
+    if not (ADMIN_KEY or INSTRUCTOR_KEY):
+        return None
+    entered = st.text_input("Staff Key", type="password", key="admin_key")
+    if not entered:
+        return None
+    if _matches(entered, ADMIN_KEY):
+        return "admin"
+    if _matches(entered, INSTRUCTOR_KEY):
+        return "instructor"
+    return None
+
+def metrics_panel():
+    st.markdown("## Rerun Timings")
+
+    stages = REGISTRY.stages()
+    if not stages:
+        st.info("No timings recorded yet.")
+        return
+
+    rows = []
+    for stage, hist in stages:
+        _, total, count = hist.snapshot()
+        rows.append({
+            "Stage": stage,
+            "Calls": count,
+            "Mean (ms)": round(1000 * total / count, 1) if count else 0.0,
+            "p50 (ms)": round(1000 * hist.quantile(0.5), 1),
+            "p95 (ms)": round(1000 * hist.quantile(0.95), 1),
+            "Total (s)": round(total, 2),
+        })
+
+    st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+    st.caption("Process-wide, since the server started. Percentiles are estimated from histogram buckets.")
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+    exposition = REGISTRY.render_prometheus()
+    c1, c2 = st.columns(2)
+    with c1:
+        st.download_button("Download Prometheus Metrics", exposition, file_name="quizlearn.prom",
+                           mime="text/plain", use_container_width=True)
+    with c2:
+        if st.button(f"Write {METRICS_PATH}", use_container_width=True):
+            st.success(f"Metrics written to {REGISTRY.write_textfile()}")
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -1,86 +1,164 @@
 import streamlit as st
-import pandas as pd
+from functools import lru_cache
 import plotly.graph_objects as go
-import plotly.express as px
-from datetime import datetime
+import numpy as np
+from storage import get_result_store
+from standings import get_rollups
+from history import history_frame, export_frame
+from downsample import lttb, visible_slice
+from export import cohort_export_panel
+from cache import get_analytics_cache
+from metrics import span
 
-def format_duration(seconds):
-    """Formats seconds into MM:SS or HH:MM:SS"""
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
-    if hours > 0:
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-    return f"{minutes:02d}:{secs:02d}"
+STUDENT_CHOICES = 50
 
-def draw_gauge_chart(percentage, topic_name):
-    fig = go.Figure(go.Indicator(
-        mode = "gauge+number",
-        value = percentage,
-        domain = {'x': [0, 1], 'y': [0, 1]},
-        title = {'text': topic_name, 'font': {'size': 18, 'color': 'white'}},
-        gauge = {
-            'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': "white"},
-            'bar': {'color': "#6366f1"},
-            'bgcolor': "rgba(0,0,0,0)",
-            'borderwidth': 2,
-            'bordercolor': "rgba(255,255,255,0.1)"
+# --- TOPIC MASTERY (all gauges in one figure) ---
+GAUGES_PER_ROW = 4
+GAUGE_HEIGHT = 220
+
+@lru_cache(maxsize=1024)
+def _gauge_trace(topic_name, percentage, accent, text_color):
+    """Indicator trace for one topic; cached on (topic, rounded percentage, theme)."""
+    return {
+        "type": "indicator",
+        "mode": "gauge+number",
+        "value": percentage,
+        "title": {"text": topic_name, "font": {"size": 18, "color": text_color}},
+        "gauge": {
+            "axis": {"range": [0, 100], "tickwidth": 1, "tickcolor": text_color},
+            "bar": {"color": accent},
+            "bgcolor": "rgba(0,0,0,0)",
+            "borderwidth": 2,
+            "bordercolor": "rgba(255,255,255,0.1)"
+        }
+    }
+
+@lru_cache(maxsize=512)
+def mastery_figure(readings, accent, text_color):
+    """One figure with a gauge per (topic, rounded percentage) reading, wrapped GAUGES_PER_ROW to a row."""
+    if not readings:
+        return go.Figure()
+    cols = min(len(readings), GAUGES_PER_ROW)
+    rows = -(-len(readings) // cols)
+    traces = []
+    for i, (topic_name, percentage) in enumerate(readings):
+        row, col = divmod(i, cols)
+        # indicator domains stand in for subplot cells; top row first
+        x0, y0 = col / cols, 1 - (row + 1) / rows
+        trace = dict(_gauge_trace(topic_name, percentage, accent, text_color))
+        trace["domain"] = {"x": [x0 + 0.03, x0 + 1 / cols - 0.03], "y": [y0 + 0.08 / rows, y0 + 0.75 / rows]}
+        traces.append(trace)
+    return go.Figure({
+        "data": traces,
+        "layout": {
+            "height": GAUGE_HEIGHT * rows,
+            "margin": dict(l=20, r=20, t=30, b=10),
+            "paper_bgcolor": 'rgba(0,0,0,0)',
+            "font": {'color': text_color, 'family': "Plus Jakarta Sans"}
         }
+    })
+
+# --- SCORE PROGRESSION (WebGL time axis, downsampled per visible range) ---
+MAX_CHART_POINTS = 1000
+
+def _to_datetime(value):
+    return value.astype("datetime64[us]").item()
+
+@st.fragment
+def _progression_chart(student, dates, scores):
+    """Only the selected window is sent to the browser, LTTB-downsampled to MAX_CHART_POINTS."""
+    lo, hi = 0, len(dates)
+    if len(dates) > MAX_CHART_POINTS and dates[0] < dates[-1]:
+        first, last = _to_datetime(dates[0]), _to_datetime(dates[-1])
+        start, end = st.slider(
+            "Visible range", min_value=first, max_value=last, value=(first, last),
+            format="YYYY-MM-DD HH:mm", key=f"progress_range_{student}"
+        )
+        lo, hi = visible_slice(dates, np.datetime64(start), np.datetime64(end))
+
+    x, y = dates[lo:hi], scores[lo:hi]
+    keep = lttb(x.astype(np.int64), y, MAX_CHART_POINTS)
+    fig = go.Figure(go.Scattergl(
+        x=x[keep], y=y[keep], mode="lines+markers",
+        line=dict(color='#a855f7'), marker=dict(size=10 if len(keep) <= 100 else 5)
     ))
     fig.update_layout(
-        height=220, 
-        margin=dict(l=20, r=20, t=50, b=20), 
+        template="plotly_dark",
         paper_bgcolor='rgba(0,0,0,0)',
-        font={'color': "white", 'family': "Plus Jakarta Sans"}
+        plot_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="Date and Time of Assessment",
+        yaxis_title="Percentage Score",
+        yaxis_range=[0, 105]
     )
-    return fig
+    st.plotly_chart(fig, use_container_width=True)
+    if len(keep) < hi - lo:
+        st.caption(f"Showing {len(keep)} of {hi - lo} attempts in this range. Narrow the range for full detail.")
+
+def build_student_analytics(store, student):
+    """Everything the analytics view needs for one student; memoized per history version.
 
-def performance_analysis():
-    if not st.session_state.quiz_history:
+    Only the compact outputs are kept; the history frame itself is dropped after the build.
+    """
+    with span("analytics.dataframe"):
+        user_df = history_frame(store.results_for(student))
+        csv = export_frame(user_df).to_csv(index=False).encode('utf-8')
+        topic_summary = user_df.groupby("topic", observed=True)["percentage"].mean().reset_index()
+        # Sorted arrays for range lookups; the chart itself is built per visible window
+        timeline = user_df[["date", "percentage"]].sort_values("date", kind="stable")
+    return {
+        "csv": csv,
+        # rounded so every student at the same level shares one cached gauge
+        "readings": tuple(zip(topic_summary["topic"].astype(str), topic_summary["percentage"].round().astype(int).tolist())),
+        "dates": timeline["date"].to_numpy("datetime64[ns]"),
+        "scores": timeline["percentage"].to_numpy(),
+    }
+
+def performance_analysis(staff=False):
+    store = get_result_store()
+    # The all-time board already lists every student with results and is kept current on submit
+    board = get_rollups().board()
+    if not len(board):
         st.info("No data available. Complete an assessment to see analytics.")
         return
 
-    df = pd.DataFrame(st.session_state.quiz_history)
-    
     # Force centering and bolding for the Profile Selection Heading
     st.markdown('<h3 style="text-align: center; font-weight: bold;">🔍 SELECT ANALYTICS PROFILE</h3>', unsafe_allow_html=True)
     
     st.markdown('<div class="custom-card">', unsafe_allow_html=True)
-    selected_user = st.selectbox("Choose a student to view and export analytics", df["student"].unique(), label_visibility="collapsed")
-    
-    user_df = df[df["student"] == selected_user].copy()
-    
-    # --- PREPARE CLEAN EXPORT DATA ---
-    export_df = user_df.copy()
-    
-    # 1. Mastery Level Formatting
-    def calculate_mastery_plain(pct):
-        if pct >= 90: return "Master"
-        if pct >= 75: return "Proficient"
-        if pct >= 50: return "Developing"
-        return "Novice"
-    export_df['Mastery Level'] = export_df['percentage'].apply(calculate_mastery_plain)
-    
-    # 2. Time Taken Formatting
-    export_df['time_taken'] = export_df['time_taken'].apply(format_duration)
-
-    # 3. Date Formatting (Convert to AM/PM)
-    def format_to_ampm(date_str):
-        try:
-            dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M")
-            return dt.strftime("%Y-%m-%d %I:%M %p")
-        except:
-            return date_str # Return original if already formatted
-    export_df['date'] = export_df['date'].apply(format_to_ampm)
+    search = st.text_input("Find a student", placeholder="Search students by name").strip()
+    rows, matches = board.page(0, STUDENT_CHOICES, search)
+    students = sorted(student for _, student, _, _ in rows)
+    # Results are stored under the title-cased display name (see take_quiz), not the registry name
+    active = st.session_state.get("active_student", "").title()
+    if active in board and active not in students and search.casefold() in active.casefold():
+        students.insert(0, active)
+    if not students:
+        st.info(f"No students match '{search}'.")
+        st.markdown('</div>', unsafe_allow_html=True)
+        return
+    if matches > STUDENT_CHOICES:
+        st.caption(f"{matches} students match; showing {STUDENT_CHOICES}. Refine the search to narrow the list.")
+    selected_user = st.selectbox("Choose a student to view and export analytics", students,
+                                 index=students.index(active) if active in students else 0,
+                                 label_visibility="collapsed")
     
-    # 4. Capitalize Headers
-    export_df.columns = [col.upper() for col in export_df.columns]
-
-    csv = export_df.to_csv(index=False).encode('utf-8')
+    analytics = get_analytics_cache().get(
+        selected_user,
+        store.history_version(selected_user),
+        lambda: build_student_analytics(store, selected_user)
+    )
+    if not len(analytics["scores"]):
+        # Submitted but not yet saved by the write-behind queue; don't keep the empty build
+        get_analytics_cache().invalidate(selected_user)
+        st.info(f"Results for {selected_user} are still being saved. Check back in a moment.")
+        st.markdown('</div>', unsafe_allow_html=True)
+        if staff:
+            cohort_export_panel(store)
+        return
     
     st.download_button(
         label=f"📥 Export Full Analytics for {selected_user} (CSV)",
-        data=csv,
+        data=analytics["csv"],
         file_name=f"QuizLearn_Analytics_{selected_user}.csv",
         mime='text/csv',
         use_container_width=True
@@ -93,27 +171,21 @@ def performance_analysis():
     
     st.markdown('<div class="custom-card">', unsafe_allow_html=True)
     st.markdown('<h4 style="text-align: center; font-weight: bold;">TOPIC MASTERY LEVEL</h4>', unsafe_allow_html=True)
-    topic_summary = user_df.groupby("topic")["percentage"].mean().reset_index()
-    gauge_cols = st.columns(len(topic_summary))
-    
-    for idx, row in topic_summary.iterrows():
-        with gauge_cols[idx]:
-            st.plotly_chart(draw_gauge_chart(row['percentage'], row['topic']), use_container_width=True)
+    with span("analytics.render_charts"):
+        gauges = mastery_figure(
+            analytics["readings"],
+            st.session_state.get("active_accent", "#6366f1"),
+            st.session_state.get("active_text", "#ffffff")
+        )
+        st.plotly_chart(gauges, use_container_width=True)
     st.markdown('</div>', unsafe_allow_html=True)
 
     st.markdown('<div class="custom-card">', unsafe_allow_html=True)
     st.markdown('<h4 style="text-align: center; font-weight: bold;">SCORE PROGRESSION OVER TIME</h4>', unsafe_allow_html=True)
-    
-    # Use format_to_ampm on the visual chart as well
-    user_df['date_display'] = user_df['date'].apply(format_to_ampm)
-    
-    line_fig = px.line(user_df, x="date_display", y="percentage", markers=True, template="plotly_dark")
-    line_fig.update_traces(line_color='#a855f7', marker=dict(size=10))
-    line_fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        xaxis_title="Date and Time of Assessment",
-        yaxis_title="Percentage Score"
-    )
-    st.plotly_chart(line_fig, use_container_width=True)
-    st.markdown('</div>', unsafe_allow_html=True)
\ No newline at end of file
+    with span("analytics.render_charts"):
+        _progression_chart(selected_user, analytics["dates"], analytics["scores"])
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # every student's history: instructors and admins only
+    if staff:
+        cohort_export_panel(store)
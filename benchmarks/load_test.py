@@ -0,0 +1,226 @@
+"""Load test: N simulated students driven through app.py with Streamlit's headless AppTest.
+
+Each student gets their own AppTest session and walks the real flow: open the
+page, log in, configure a paper, answer every question, validate, submit, then
+view Analytics and the Hall of Fame. Every rerun is timed and tagged with the
+step (and so the section) it belongs to.
+
+AppTest is not thread-safe, so concurrency comes from worker processes that
+share one SQLite store; each worker drives its students one after another.
+AppTest has no fragment support of its own: every widget change reruns the whole
+script, so the "answer" step measures a full-page rerun, not the fragment-only
+rerun a browser gets when a question is answered. Treat it as an upper bound.
+
+Memory per session is the pickled size of the session state (what the server
+keeps per browser tab); --trace-memory also reports retained heap via tracemalloc,
+which slows every rerun down and so is off by default.
+
+    python benchmarks/load_test.py --students 50 --concurrency 8 --label my-branch
+    python benchmarks/load_test.py --compare
+
+Runs append one JSON line to benchmarks/results.jsonl; --compare prints the p95
+of each step for the recorded runs side by side.
+"""
+import argparse
+import json
+import os
+import multiprocessing
+import pickle
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(HERE, os.pardir, "app.py")
+RESULTS = os.path.join(HERE, "results.jsonl")
+
+# step -> section it exercises
+STEPS = {
+    "open": "Assessment",
+    "login": "Assessment",
+    "configure": "Assessment",
+    "start": "Assessment",
+    "answer": "Assessment",
+    "validate": "Assessment",
+    "submit": "Assessment",
+    "analytics": "Analytics",
+    "hall_of_fame": "Hall of Fame",
+}
+
+def _git_label():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True, text=True)
+        return out.stdout.strip() or "unknown"
+    except OSError:
+        return "unknown"
+
+def percentiles(samples):
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+    return {
+        "count": len(ordered),
+        "p50": round(pick(0.50), 2),
+        "p95": round(pick(0.95), 2),
+        "p99": round(pick(0.99), 2),
+        "max": round(ordered[-1], 2),
+        "mean": round(statistics.fmean(ordered), 2),
+    }
+
+class SimulatedStudent:
+    def __init__(self, index, questions, timings):
+        from streamlit.testing.v1 import AppTest
+        self.at = AppTest.from_file(APP, default_timeout=60)
+        self.name = f"loadtest student {index:05d}"
+        self.questions = questions
+        self._timings = timings
+
+    def _run(self, step, action=None):
+        start = time.perf_counter()
+        (action or self.at).run()
+        elapsed = (time.perf_counter() - start) * 1000
+        if self.at.exception:
+            raise RuntimeError(f"{self.name} failed at {step}: {self.at.exception[0].message}")
+        self._timings[step].append(elapsed)
+
+    def _button(self, label):
+        return next(b for b in self.at.button if b.label == label)
+
+    def session(self):
+        at = self.at
+        self._run("open")
+        self._run("login", at.text_input[0].input(self.name))
+        self._run("configure", at.select_slider[0].set_value(self.questions))
+        self._run("start", self._button("Initialize Assessment").click())
+        for radio in [r for r in at.radio if r.key and r.key.startswith("q_")]:
+            self._run("answer", radio.set_value(0))
+        self._run("validate", self._button("Validate Answers").click())
+        self._run("submit", self._button("Submit to Hall of Fame").click())
+        self._run("analytics", at.radio(key="active_section").set_value("Analytics"))
+        self._run("hall_of_fame", at.radio(key="active_section").set_value("Hall of Fame"))
+        return self
+
+    def state_bytes(self):
+        state = {}
+        for key in list(self.at.session_state.keys()):
+            try:
+                state[key] = pickle.dumps(self.at.session_state[key])
+            except Exception:
+                continue  # unpicklable helpers (callbacks etc.) aren't per-session data
+        return sum(len(v) for v in state.values())
+
+def _worker(job):
+    """Runs one worker's students sequentially; returns raw timings and memory figures."""
+    indices, questions, trace_memory = job
+    sys.path.insert(0, os.path.dirname(APP))
+    timings = defaultdict(list)
+
+    # Warm-up (imports, first script compile) is not what we want to measure
+    SimulatedStudent(-1 - indices[0], questions, defaultdict(list)).session()
+
+    if trace_memory:
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+    # Only the measured sessions count towards throughput, not pool spawn or warm-up
+    started = time.perf_counter()
+    sessions = [SimulatedStudent(i, questions, timings).session() for i in indices]
+    elapsed = time.perf_counter() - started
+    retained = tracemalloc.get_traced_memory()[0] - baseline if trace_memory else None
+    if trace_memory:
+        tracemalloc.stop()
+    return {
+        "timings": dict(timings),
+        "state_bytes": [s.state_bytes() for s in sessions],
+        "retained_bytes": retained,
+        "sessions": len(sessions),
+        "elapsed_s": elapsed,
+    }
+
+def run(args):
+    # Isolated store and spool so a benchmark never touches (or replays) real results
+    workdir = tempfile.mkdtemp(prefix="quizlearn-bench-")
+    os.environ["QUIZLEARN_DB"] = os.path.join(workdir, "bench.db")
+    os.environ["QUIZLEARN_EXPORT_DIR"] = os.path.join(workdir, "exports")
+    os.environ["QUIZLEARN_SPOOL"] = os.path.join(workdir, "bench.spool.jsonl")
+
+    workers = max(1, min(args.concurrency, args.students))
+    jobs = [(list(range(w, args.students, workers)), args.questions, args.trace_memory) for w in range(workers)]
+
+    started = time.perf_counter()
+    with multiprocessing.get_context("spawn").Pool(workers) as pool:
+        outcomes = pool.map(_worker, jobs)
+    wall = time.perf_counter() - started
+
+    timings = defaultdict(list)
+    for outcome in outcomes:
+        for step, samples in outcome["timings"].items():
+            timings[step].extend(samples)
+    state_bytes = [b for outcome in outcomes for b in outcome["state_bytes"]]
+
+    record = {
+        "label": args.label,
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "students": args.students,
+        "concurrency": workers,
+        "questions": args.questions,
+        "wall_s": round(wall, 2),
+        # workers run side by side, so their individual rates add up
+        "throughput_submits_per_s": round(sum(o["sessions"] / o["elapsed_s"] for o in outcomes), 2),
+        "session_state_kb": round(statistics.fmean(state_bytes) / 1024, 2),
+        "steps": {step: percentiles(samples) for step, samples in timings.items()},
+        "sections": {
+            section: percentiles([t for step, samples in timings.items() if STEPS[step] == section for t in samples])
+            for section in sorted(set(STEPS.values()))
+        },
+    }
+    if args.trace_memory:
+        retained = sum(o["retained_bytes"] for o in outcomes)
+        record["retained_heap_per_session_kb"] = round(retained / len(state_bytes) / 1024, 1)
+    with open(args.output, "a", encoding="utf-8") as fh:
+        fh.write(json.dumps(record) + "\n")
+    return record
+
+def report(record):
+    print(f"{record['label']}: {record['students']} students x {record['questions']} questions, "
+          f"concurrency {record['concurrency']}")
+    print(f"  wall {record['wall_s']}s, {record['throughput_submits_per_s']} submits/s, "
+          f"{record['session_state_kb']} KiB session state/session")
+    if "retained_heap_per_session_kb" in record:
+        print(f"  {record['retained_heap_per_session_kb']} KiB retained heap/session")
+    print(f"  {'rerun latency (ms)':<20}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for name, stats in list(record["sections"].items()) + list(record["steps"].items()):
+        print(f"  {name:<20}{stats['p50']:>9}{stats['p95']:>9}{stats['p99']:>9}{stats['max']:>9}")
+
+def compare(path):
+    with open(path, encoding="utf-8") as fh:
+        records = [json.loads(line) for line in fh if line.strip()]
+    if not records:
+        print("no recorded runs")
+        return
+    steps = list(STEPS)
+    print(f"{'p95 (ms)':<28}" + "".join(f"{s[:12]:>13}" for s in steps))
+    for rec in records:
+        row = "".join(f"{rec['steps'].get(s, {}).get('p95', '-'):>13}" for s in steps)
+        print(f"{(rec['label'] + ' ' + rec['timestamp'][:10])[:27]:<28}{row}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--questions", type=int, default=10, choices=[1, 3, 5, 10])
+    parser.add_argument("--label", default=_git_label())
+    parser.add_argument("--output", default=RESULTS)
+    parser.add_argument("--trace-memory", action="store_true", help="also measure retained heap (slow)")
+    parser.add_argument("--compare", action="store_true", help="print recorded runs and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(args.output)
+    else:
+        report(run(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Startup benchmark: cold start to first paint of the login box, in a fresh interpreter.
+
+Every run spawns a new Python process (nothing imported, nothing cached), which
+imports Streamlit and executes app.py once through the headless AppTest runner,
+the same script run a browser's first page load triggers. A run is complete
+once the "Enter Student Name" box is in the rendered tree. Reported per run:
+
+    total_ms   process spawn -> login box rendered (what a user waits after a restart)
+    import_ms  interpreter up -> streamlit imported
+    script_ms  first execution of app.py, including every import it triggers
+
+It also records which heavy analytics modules (pandas, plotly, pyarrow) app.py
+itself pulled in, beyond what Streamlit already loaded; on the login screen
+that list should be empty.
+
+    python benchmarks/startup.py --runs 5 --label my-branch
+    python benchmarks/startup.py --compare
+
+Runs append one JSON line to benchmarks/startup.jsonl.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.abspath(os.path.join(HERE, os.pardir, "app.py"))
+RESULTS = os.path.join(HERE, "startup.jsonl")
+LOGIN_LABEL = "Enter Student Name"
+HEAVY_MODULES = ("pandas", "plotly", "pyarrow")
+
+def _git_label():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True, text=True)
+        return out.stdout.strip() or "unknown"
+    except OSError:
+        return "unknown"
+
+def _child():
+    """Runs inside the fresh process: one cold page load, timings printed as JSON."""
+    started = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    imported = time.perf_counter()
+    preloaded = set(sys.modules)
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.run()
+    rendered = time.perf_counter()
+    if at.exception:
+        raise SystemExit(f"app.py failed: {at.exception[0].message}")
+    if not any(box.label == LOGIN_LABEL for box in at.text_input):
+        raise SystemExit("login box was not rendered")
+    print(json.dumps({
+        "import_ms": (imported - started) * 1000,
+        "script_ms": (rendered - imported) * 1000,
+        "heavy_modules": sorted(m for m in HEAVY_MODULES if m in sys.modules and m not in preloaded),
+    }))
+
+def measure_once(workdir):
+    env = dict(os.environ, QUIZLEARN_DB=os.path.join(workdir, "startup.db"),
+               QUIZLEARN_EXPORT_DIR=os.path.join(workdir, "exports"),
+               QUIZLEARN_SPOOL=os.path.join(workdir, "startup.spool.jsonl"))
+    started = time.perf_counter()
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child"],
+                         cwd=os.path.dirname(APP), env=env, capture_output=True, text=True)
+    total = (time.perf_counter() - started) * 1000
+    if out.returncode:
+        raise RuntimeError(out.stderr.strip() or out.stdout.strip())
+    sample = json.loads(out.stdout.strip().splitlines()[-1])
+    sample["total_ms"] = total
+    return sample
+
+def summarize(samples, field):
+    values = sorted(s[field] for s in samples)
+    return {
+        "min": round(values[0], 1),
+        "median": round(statistics.median(values), 1),
+        "max": round(values[-1], 1),
+    }
+
+def run(args):
+    workdir = tempfile.mkdtemp(prefix="quizlearn-startup-")
+    samples = [measure_once(workdir) for _ in range(args.runs)]
+    record = {
+        "label": args.label,
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "runs": args.runs,
+        "python": sys.version.split()[0],
+        "total_ms": summarize(samples, "total_ms"),
+        "import_ms": summarize(samples, "import_ms"),
+        "script_ms": summarize(samples, "script_ms"),
+        "heavy_modules": sorted({m for s in samples for m in s["heavy_modules"]}),
+    }
+    with open(args.output, "a", encoding="utf-8") as fh:
+        fh.write(json.dumps(record) + "\n")
+    return record
+
+def report(record):
+    print(f"{record['label']}: {record['runs']} cold starts (python {record['python']})")
+    print(f"  {'(ms)':<12}{'min':>9}{'median':>9}{'max':>9}")
+    for field in ("total_ms", "import_ms", "script_ms"):
+        stats = record[field]
+        print(f"  {field:<12}{stats['min']:>9}{stats['median']:>9}{stats['max']:>9}")
+    print(f"  heavy modules on first paint: {', '.join(record['heavy_modules']) or 'none'}")
+
+def compare(path):
+    with open(path, encoding="utf-8") as fh:
+        records = [json.loads(line) for line in fh if line.strip()]
+    if not records:
+        print("no recorded runs")
+        return
+    print(f"{'median (ms)':<28}{'total':>9}{'import':>9}{'script':>9}  heavy modules")
+    for rec in records:
+        print(f"{(rec['label'] + ' ' + rec['timestamp'][:10])[:27]:<28}"
+              f"{rec['total_ms']['median']:>9}{rec['import_ms']['median']:>9}{rec['script_ms']['median']:>9}"
+              f"  {', '.join(rec['heavy_modules']) or '-'}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--label", default=_git_label())
+    parser.add_argument("--output", default=RESULTS)
+    parser.add_argument("--compare", action="store_true", help="print recorded runs and exit")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child()
+    elif args.compare:
+        compare(args.output)
+    else:
+        report(run(args))
+
+if __name__ == "__main__":
+    main()
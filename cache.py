@@ -0,0 +1,49 @@
+import threading
+from collections import OrderedDict
+import streamlit as st
+
+class AnalyticsCache:
+    """Bounded LRU of per-student analytics, keyed on (student, history version)."""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()   # (student, version) -> value
+        self._by_student = {}           # student -> set of live keys
+        self._lock = threading.Lock()
+
+    def get(self, student, version, build):
+        key = (student, version)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        # Build outside the lock so one slow student doesn't stall the rest
+        value = build()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._by_student.setdefault(student, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._forget(self._entries.popitem(last=False)[0])
+        return value
+
+    def invalidate(self, student):
+        """Drops every cached entry for one student, leaving everyone else warm."""
+        with self._lock:
+            for key in self._by_student.pop(student, ()):
+                self._entries.pop(key, None)
+
+    def _forget(self, key):
+        keys = self._by_student.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_student[key[0]]
+
+    def __len__(self):
+        return len(self._entries)
+
+@st.cache_resource
+def get_analytics_cache():
+    """Process-wide analytics cache shared by every session."""
+    return AnalyticsCache()
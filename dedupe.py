@@ -0,0 +1,129 @@
+"""Near-duplicate question detection: character shingles, MinHash signatures and LSH bands.
+
+    python dedupe.py                      # scan the configured question bank
+    python dedupe.py --threshold 0.7 --bank-dir path/to/banks
+"""
+import argparse
+import re
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+SHINGLE_SIZE = 4
+NUM_PERM = 128
+BANDS = 32                 # 32 bands x 4 rows: pairs above ~0.42 similarity usually collide
+DEFAULT_THRESHOLD = 0.5
+_PRIME = (1 << 61) - 1
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+def question_text(question):
+    """Stem plus options (order-independent), the text two questions are compared on."""
+    return question.text + " | " + " | ".join(sorted(question.options))
+
+def _normalize(text):
+    return re.sub(r"[^\w]+", " ", text.casefold()).strip()
+
+def shingles(text, k=SHINGLE_SIZE):
+    """Distinct 32-bit hashes of the text's character k-grams, computed as one vectorized rolling hash."""
+    data = np.frombuffer(_normalize(text).encode("utf-8"), dtype=np.uint8).astype(np.uint64)
+    if len(data) < k:
+        data = np.pad(data, (0, k - len(data)))
+    powers = np.uint64(257) ** np.arange(k - 1, -1, -1, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        hashes = (sliding_window_view(data, k) * powers).sum(axis=1) * _MIX
+    return np.unique(hashes >> np.uint64(32))
+
+class DuplicateIndex:
+    """MinHash/LSH index over question texts, grown one item at a time.
+
+    Each item is reduced to NUM_PERM MinHash values and filed under one bucket
+    per band; only items sharing a bucket are ever compared, so indexing n items
+    costs O(n) signature work plus the (few) candidate checks. Similarity is the
+    MinHash estimate of the Jaccard index of the two shingle sets.
+    """
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM, bands=BANDS, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.rows = num_perm // bands
+        rng = np.random.default_rng(seed)
+        # (a*x + b) mod p permutations, the usual 64-bit wrapping variant
+        self._a = rng.integers(1, _PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self._band_mix = rng.integers(1, 1 << 63, size=self.rows, dtype=np.uint64) | np.uint64(1)
+        self._buckets = [{} for _ in range(bands)]  # band -> {band hash: [item positions]}
+        self._keys = []
+        self._signatures = []
+
+    def __len__(self):
+        return len(self._keys)
+
+    def signature(self, text):
+        with np.errstate(over="ignore"):
+            hashed = (self._a * shingles(text) + self._b) % np.uint64(_PRIME)
+        return (hashed & _MAX_HASH).min(axis=1)
+
+    def _bands(self, signature):
+        """One 64-bit bucket key per band (a false collision only costs one extra comparison)."""
+        with np.errstate(over="ignore"):
+            return (signature.reshape(-1, self.rows) * self._band_mix).sum(axis=1).tolist()
+
+    def query(self, text):
+        """(key, similarity) of indexed items at or above the threshold, most similar first."""
+        signature = self.signature(text)
+        return self._matches(signature, self._bands(signature))
+
+    def _matches(self, signature, bands):
+        candidates = set()
+        for buckets, band in zip(self._buckets, bands):
+            candidates.update(buckets.get(band, ()))
+        found = []
+        for pos in candidates:
+            similarity = float(np.mean(self._signatures[pos] == signature))
+            if similarity >= self.threshold:
+                found.append((self._keys[pos], similarity))
+        return sorted(found, key=lambda match: -match[1])
+
+    def add(self, key, text):
+        """Indexes one item and returns its matches among the items indexed before it."""
+        signature = self.signature(text)
+        bands = self._bands(signature)
+        matches = self._matches(signature, bands)
+        pos = len(self._keys)
+        self._keys.append(key)
+        self._signatures.append(signature)
+        for buckets, band in zip(self._buckets, bands):
+            buckets.setdefault(band, []).append(pos)
+        return matches
+
+    def add_many(self, items):
+        """Indexes (key, text) items; returns every (key, earlier key, similarity) pair found."""
+        return [(key, other, similarity) for key, text in items for other, similarity in self.add(key, text)]
+
+def bank_items(bank, version=None):
+    """((topic, difficulty, position), text) for every question of one bank version."""
+    flat = bank.flat_index(version)
+    for (topic, difficulty), (start, end) in flat.offsets.items():
+        for pos in range(start, end):
+            yield (topic, difficulty, pos - start), question_text(flat.questions[pos])
+
+def main():
+    from question_bank import QuestionBank, BANK_DIR
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bank-dir", default=BANK_DIR)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    bank = QuestionBank(args.bank_dir)
+    items = dict(bank_items(bank))
+    index = DuplicateIndex(args.threshold)
+    pairs = index.add_many(items.items())
+    for key, other, similarity in sorted(pairs, key=lambda pair: -pair[2]):
+        print(f"{similarity:.2f}  {'/'.join(map(str, other))}  <->  {'/'.join(map(str, key))}")
+        print(f"      {items[other]}\n      {items[key]}")
+    print(f"{len(pairs)} near-duplicate pairs among {len(index)} questions (threshold {args.threshold})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import numpy as np
+
+def lttb(x, y, threshold):
+    """Largest-Triangle-Three-Buckets: indices of `threshold` points that keep a series' visual shape.
+
+    The first and last points are always kept; every bucket in between keeps the
+    point forming the largest triangle with the previous pick and the next
+    bucket's average. x must be sorted ascending.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # threshold - 2 buckets over the interior points; each holds at least one point since n > threshold
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+    picked = np.empty(threshold, dtype=np.intp)
+    picked[0], picked[-1] = 0, n - 1
+
+    a = 0
+    for b in range(threshold - 2):
+        start, end = edges[b], edges[b + 1]
+        nxt_start, nxt_end = (edges[b + 1], edges[b + 2]) if b + 2 < len(edges) else (n - 1, n)
+        avg_x = x[nxt_start:nxt_end].mean()
+        avg_y = y[nxt_start:nxt_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        picked[b + 1] = a
+    return picked
+
+def visible_slice(x, lo, hi):
+    """Index bounds of the points with lo <= x <= hi, by binary search over sorted x."""
+    return np.searchsorted(x, lo, side="left"), np.searchsorted(x, hi, side="right")
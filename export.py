@@ -0,0 +1,141 @@
+import os
+import re
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import streamlit as st
+from history import history_frame, export_frame, mastery_levels
+
+EXPORT_DIR = os.environ.get("QUIZLEARN_EXPORT_DIR", "exports")
+EXPORT_WORKERS = 4
+PARQUET_CHUNK_ROWS = 50_000
+
+def _safe_name(student):
+    return re.sub(r"[^\w.-]+", "_", student).strip("_") or "student"
+
+def _entry_name(student, used):
+    """Zip member for one student's CSV; names that sanitize alike ("O'Brien", "O Brien") get a counter."""
+    base = f"QuizLearn_Analytics_{_safe_name(student)}"
+    name, n = f"{base}.csv", 1
+    while name in used:
+        n += 1
+        name = f"{base}_{n}.csv"
+    used.add(name)
+    return name
+
+class BulkExportJob:
+    """Cohort export on a background thread: a zip of per-student CSVs plus one Parquet file.
+
+    Per-student CSVs are rendered on a worker pool and written into the zip as they
+    finish; the Parquet file is streamed from the store in chunks. Neither output is
+    ever held in memory as a whole.
+    """
+
+    def __init__(self, store, out_dir=EXPORT_DIR, workers=EXPORT_WORKERS):
+        self.store = store
+        self.workers = workers
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        os.makedirs(out_dir, exist_ok=True)
+        self.zip_path = os.path.join(out_dir, f"QuizLearn_Cohort_{stamp}.zip")
+        self.parquet_path = os.path.join(out_dir, f"QuizLearn_History_{stamp}.parquet")
+        self.total = 0
+        self.done = 0
+        self.status = "pending"
+        self.error = None
+        self.upto = None
+        self._thread = threading.Thread(target=self._run, name="bulk-export", daemon=True)
+
+    def start(self):
+        self.status = "running"
+        self._thread.start()
+        return self
+
+    @property
+    def progress(self):
+        return self.done / self.total if self.total else 0.0
+
+    @property
+    def finished(self):
+        return self.status in ("done", "failed")
+
+    # --- WORKERS ---
+    def _student_csv(self, student):
+        user_df = history_frame(self.store.results_for(student, upto=self.upto))
+        return student, export_frame(user_df).to_csv(index=False).encode("utf-8")
+
+    def _run(self):
+        try:
+            # Pin every worker to the same cut of the history
+            self.upto = self.store.snapshot()
+            students = self.store.students(upto=self.upto)
+            # one unit per student CSV plus one for the Parquet file
+            self.total = len(students) + 1
+            self._write_zip(students)
+            self._write_parquet()
+            self.done += 1
+            self.status = "done"
+        except Exception as exc:
+            self.error = str(exc)
+            self.status = "failed"
+
+    def _write_zip(self, students):
+        window = self.workers * 2  # bounds the CSVs in flight
+        used = set()
+        with zipfile.ZipFile(self.zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf, \
+                ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="export") as pool:
+            for start in range(0, len(students), window):
+                for student, csv in pool.map(self._student_csv, students[start:start + window]):
+                    zf.writestr(_entry_name(student, used), csv)
+                    self.done += 1
+
+    def _write_parquet(self):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow)")
+
+        labels = pa.dictionary(pa.int32(), pa.string())
+        schema = pa.schema([
+            ("student", labels),
+            ("topic", labels),
+            ("difficulty", labels),
+            ("score", pa.int16()),
+            ("total", pa.int16()),
+            ("percentage", pa.int16()),
+            ("date", pa.timestamp("us")),
+            ("time_taken", pa.int32()),
+            ("mastery_level", pa.dictionary(pa.int8(), pa.string(), ordered=True)),
+        ])
+        with pq.ParquetWriter(self.parquet_path, schema) as writer:
+            for rows in self.store.iter_results(PARQUET_CHUNK_ROWS, upto=self.upto):
+                chunk = history_frame(rows)
+                chunk["mastery_level"] = mastery_levels(chunk["percentage"])
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+def cohort_export_panel(store):
+    """Instructor panel: start a bulk export and follow its progress."""
+    with st.expander("📦 Cohort Export (all students)"):
+        job = st.session_state.get("export_job")
+        if job is None or job.finished:
+            if job is not None and job.status == "failed":
+                st.error(f"Export failed: {job.error}")
+            if st.button("Run Bulk Export", use_container_width=True):
+                st.session_state.export_job = BulkExportJob(store).start()
+                st.rerun()
+        if job is not None and job.status == "done":
+            with open(job.zip_path, "rb") as fh:
+                st.download_button("📥 Per-student CSVs (ZIP)", fh, file_name=os.path.basename(job.zip_path),
+                                   mime="application/zip", use_container_width=True)
+            with open(job.parquet_path, "rb") as fh:
+                st.download_button("📥 Full History (Parquet)", fh, file_name=os.path.basename(job.parquet_path),
+                                   mime="application/octet-stream", use_container_width=True)
+        elif job is not None and not job.finished:
+            _export_progress(job)
+
+@st.fragment(run_every="1s")
+def _export_progress(job):
+    st.progress(job.progress, text=f"Exporting {job.done}/{job.total}")
+    if job.finished:
+        st.rerun()
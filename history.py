@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+from storage import RESULT_COLUMNS
+
+# Typed columnar layout for result history
+HISTORY_DTYPES = {
+    "student": "category",
+    "topic": "category",
+    "difficulty": "category",
+    "score": "int16",
+    "total": "int16",
+    "percentage": "int16",
+    "time_taken": "int32",
+}
+MASTERY_BINS = [-np.inf, 50, 75, 90, np.inf]
+MASTERY_LABELS = ["Novice", "Developing", "Proficient", "Master"]
+
+def history_frame(rows):
+    """Builds the typed history frame: real datetimes, small ints, categorical labels."""
+    df = pd.DataFrame.from_records(rows, columns=RESULT_COLUMNS)
+    df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%d %H:%M")
+    return df.astype(HISTORY_DTYPES)
+
+def mastery_levels(percentages):
+    """Vectorized mastery bucketing (>=90 Master, >=75 Proficient, >=50 Developing)."""
+    return pd.cut(percentages, bins=MASTERY_BINS, labels=MASTERY_LABELS, right=False)
+
+def format_durations(seconds):
+    """Formats a seconds column into MM:SS or HH:MM:SS"""
+    hours = seconds // 3600
+    mm_ss = ((seconds % 3600) // 60).astype(str).str.zfill(2) + ":" + (seconds % 60).astype(str).str.zfill(2)
+    return mm_ss.where(hours == 0, hours.astype(str).str.zfill(2) + ":" + mm_ss)
+
+def format_dates(dates):
+    """Formats a datetime column as YYYY-MM-DD HH:MM AM/PM"""
+    return dates.dt.strftime("%Y-%m-%d %I:%M %p")
+
+def export_frame(user_df):
+    """Clean, human-readable export layout for a slice of typed history."""
+    export_df = user_df.copy()
+    
+    # 1. Mastery Level Formatting
+    export_df['Mastery Level'] = mastery_levels(export_df['percentage'])
+    
+    # 2. Time Taken Formatting
+    export_df['time_taken'] = format_durations(export_df['time_taken'])
+
+    # 3. Date Formatting (Convert to AM/PM)
+    export_df['date'] = format_dates(export_df['date'])
+    
+    # 4. Capitalize Headers
+    export_df.columns = [col.upper() for col in export_df.columns]
+    return export_df
@@ -1,28 +1,56 @@
 import streamlit as st
 import pandas as pd
+from standings import get_rollups, WINDOWS, ALL
+from theme import DIFFICULTY_COLORS
+from metrics import span
+
+PAGE_SIZE = 25
 
 def leaderboard():
     st.markdown("## Leaderboard")
 
-    if not st.session_state.quiz_history:
+    rollups = get_rollups()
+    if not len(rollups.board()):
         st.info("No data available.")
         return
 
-    df = pd.DataFrame(st.session_state.quiz_history)
-    leaderboard_df = (df.groupby("student")
-                      .agg(Average_Percentage=("percentage","mean"), Quizzes_Taken=("student","count"))
-                      .reset_index()
-                      .sort_values("Average_Percentage", ascending=False))
-    leaderboard_df["Average_Percentage"] = leaderboard_df["Average_Percentage"].round(1)
-    leaderboard_df = leaderboard_df.rename(columns={
-        "student":"Student", "Average_Percentage":"Average Percentage", "Quizzes_Taken":"Quizzes Taken"
-    })
+    # --- FILTERS (each combination is a precomputed rollup) ---
+    levels = list(DIFFICULTY_COLORS) + [d for d in rollups.difficulties() if d not in DIFFICULTY_COLORS]
+    c1, c2, c3 = st.columns([2, 1, 2])
+    with c1:
+        topic = st.selectbox("Subject", [ALL] + rollups.topics(), format_func=lambda t: t or "All Subjects")
+    with c2:
+        difficulty = st.selectbox("Difficulty", [ALL] + levels, format_func=lambda d: d or "All Levels")
+    with c3:
+        window = st.radio("Window", WINDOWS, horizontal=True)
+    search = st.text_input("Search", placeholder="Find a student by name").strip()
+
+    board = rollups.board(topic, difficulty, window)
+    _, matches = board.page(0, 0, search)
+    if not matches:
+        st.info("No students match this view yet.")
+        return
+
+    pages = -(-matches // PAGE_SIZE)
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1,
+                           key=f"leaderboard_page_{topic}_{difficulty}_{window}_{search}")
+
+    # Only the visible page is ranked, framed and charted
+    with span("leaderboard.frame"):
+        rows, _ = board.page(page - 1, PAGE_SIZE, search)
+        leaderboard_df = pd.DataFrame.from_records(rows, columns=["Rank", "Student", "Average Percentage", "Quizzes Taken"])
+        leaderboard_df["Average Percentage"] = leaderboard_df["Average Percentage"].round(1)
+        leaderboard_df["Quizzes Taken"] = leaderboard_df["Quizzes Taken"].round(1)
 
     st.markdown('<div class="card">', unsafe_allow_html=True)
+    first = (page - 1) * PAGE_SIZE + 1
+    matching = f" matching '{search}'" if search else ""
+    st.caption(f"Showing {first}-{first + len(rows) - 1} of {matches} students{matching} ({len(board)} ranked)")
+    st.caption("Averages are weighted by questions answered. A mixed paper counts as one quiz, "
+               "shared across its subjects and levels by question count.")
     col1, col2 = st.columns([2,1])
     with col1:
-        st.dataframe(leaderboard_df[["Student","Average Percentage","Quizzes Taken"]],
-                     use_container_width=True)
+        st.dataframe(leaderboard_df, use_container_width=True, hide_index=True)
     with col2:
         st.bar_chart(leaderboard_df.set_index("Student")["Average Percentage"])
     st.markdown('</div>', unsafe_allow_html=True)
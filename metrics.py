@@ -0,0 +1,131 @@
+import bisect
+import functools
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# The periodic text-file export only runs when a path is configured
+METRICS_EXPORT = "QUIZLEARN_METRICS_PATH" in os.environ
+METRICS_PATH = os.environ.get("QUIZLEARN_METRICS_PATH", os.path.join("metrics", "quizlearn.prom"))
+EXPORT_INTERVAL = float(os.environ.get("QUIZLEARN_METRICS_INTERVAL", "15"))
+
+# Upper bounds in seconds, Prometheus style (last bucket is +Inf)
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, math.inf)
+
+class Histogram:
+    """Fixed-bucket latency histogram; one lock per stage so stages never contend."""
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.total = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        idx = bisect.bisect_left(BUCKETS, seconds)
+        with self._lock:
+            self.counts[idx] += 1
+            self.total += seconds
+            self.count += 1
+
+    def snapshot(self):
+        with self._lock:
+            return list(self.counts), self.total, self.count
+
+    def quantile(self, q):
+        """Estimate by linear interpolation inside the bucket holding the q-th observation."""
+        counts, _, count = self.snapshot()
+        if not count:
+            return 0.0
+        rank, seen, lower = q * count, 0, 0.0
+        for upper, n in zip(BUCKETS, counts):
+            if n and seen + n >= rank:
+                if math.isinf(upper):
+                    return lower
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+            lower = upper
+        return lower
+
+class MetricsRegistry:
+    """Process-wide stage timings, aggregated across every session."""
+
+    def __init__(self):
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, stage):
+        hist = self._histograms.get(stage)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(stage, Histogram())
+        return hist
+
+    def stages(self):
+        return sorted(self._histograms.items())
+
+    def render_prometheus(self):
+        lines = [
+            "# HELP quizlearn_stage_duration_seconds Time spent in each rerun stage.",
+            "# TYPE quizlearn_stage_duration_seconds histogram",
+        ]
+        for stage, hist in self.stages():
+            counts, total, count = hist.snapshot()
+            label = stage.replace("\\", "\\\\").replace('"', '\\"')
+            cumulative = 0
+            for upper, n in zip(BUCKETS, counts):
+                cumulative += n
+                le = "+Inf" if math.isinf(upper) else repr(upper)
+                lines.append(f'quizlearn_stage_duration_seconds_bucket{{stage="{label}",le="{le}"}} {cumulative}')
+            lines.append(f'quizlearn_stage_duration_seconds_sum{{stage="{label}"}} {total:.6f}')
+            lines.append(f'quizlearn_stage_duration_seconds_count{{stage="{label}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path=METRICS_PATH):
+        """Atomically writes the Prometheus text format (node_exporter textfile collector style)."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(self.render_prometheus())
+        os.replace(tmp, path)
+        return path
+
+REGISTRY = MetricsRegistry()
+
+@contextmanager
+def span(stage):
+    """Times the enclosed block into the `stage` histogram (also when it exits via st.rerun())."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        REGISTRY.histogram(stage).observe(time.perf_counter() - start)
+
+def timed(stage):
+    """Decorator form of span()."""
+    def decorate(fn):
+        # st.fragment ids come from module.qualname, so the wrapper must carry fn's
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+_exporter = None
+_exporter_lock = threading.Lock()
+
+def start_textfile_exporter(path=METRICS_PATH, interval=EXPORT_INTERVAL):
+    """Rewrites the metrics file every `interval` seconds from a daemon thread (idempotent)."""
+    global _exporter
+    with _exporter_lock:
+        if _exporter is not None:
+            return
+        def loop():
+            while True:
+                time.sleep(interval)
+                REGISTRY.write_textfile(path)
+        _exporter = threading.Thread(target=loop, name="metrics-exporter", daemon=True)
+        _exporter.start()
@@ -0,0 +1,162 @@
+import base64
+import json
+import random
+from array import array
+from collections import namedtuple
+from datetime import datetime
+from functools import lru_cache
+from state import get_question_bank
+
+# A paper is fully described by where its questions come from and how they were drawn.
+# Adaptive papers carry their drawn pool positions in `items` instead of relying on the seed;
+# mixed papers list (topic, difficulty, quota) `strata` drawn from the bank's flat index.
+PaperSpec = namedtuple("PaperSpec", "bank_version topic difficulty seed count items strata", defaults=(None, None))
+LEVELS = ("Easy", "Medium", "Hard")
+MAX_TITLE = 80
+QUESTION_COUNTS = (1, 3, 5, 10)  # sizes offered for a single-subject paper
+MAX_PER_STRATUM = 50             # largest per-subject quota offered for a mixed paper
+
+def new_paper(bank, topic, difficulty, count):
+    return PaperSpec(bank.version, topic, difficulty, random.getrandbits(32), count)
+
+def new_mixed_paper(bank, title, strata):
+    strata = tuple((topic, difficulty, n) for topic, difficulty, n in strata if n > 0)
+    return PaperSpec(bank.version, title, "Mixed", random.getrandbits(32), sum(n for _, _, n in strata), None, strata)
+
+def paper_pool(spec):
+    return get_question_bank().pool(spec.topic, spec.difficulty.lower(), spec.bank_version)
+
+@lru_cache(maxsize=2048)
+def paper_items(spec):
+    """Pool positions of a paper's questions, regenerated deterministically from the spec."""
+    if spec.items is not None:
+        return tuple(spec.items)
+    if spec.strata is not None:
+        # one slice + sample per stratum over the flat index
+        flat = get_question_bank().flat_index(spec.bank_version)
+        rng = random.Random(spec.seed)
+        picks = []
+        for topic, difficulty, n in spec.strata:
+            stratum = flat.stratum(topic, difficulty.lower())
+            picks.extend(rng.sample(stratum, min(n, len(stratum))))
+        return tuple(picks)
+    pool = paper_pool(spec)
+    return tuple(random.Random(spec.seed).sample(range(len(pool)), min(spec.count, len(pool))))
+
+@lru_cache(maxsize=2048)
+def paper_questions(spec):
+    """A paper's questions, against its pinned bank version."""
+    if spec.strata is not None:
+        pool = get_question_bank().flat_index(spec.bank_version).questions
+    else:
+        pool = paper_pool(spec)
+    return tuple(pool[i] for i in paper_items(spec))
+
+@lru_cache(maxsize=2048)
+def paper_origins(spec):
+    """(topic, difficulty) of each question in order; for mixed papers, the stratum it was drawn from."""
+    if spec.strata is None:
+        return ((spec.topic, spec.difficulty),) * len(paper_items(spec))
+    flat = get_question_bank().flat_index(spec.bank_version)
+    origins = []
+    for topic, difficulty, n in spec.strata:
+        origins.extend([(topic, difficulty)] * min(n, len(flat.stratum(topic, difficulty.lower()))))
+    return tuple(origins)
+
+def paper_results(spec, student, correctness, date, time_taken):
+    """(result, question positions) per real topic/difficulty the paper covers.
+
+    A mixed paper's title is never stored as a topic: its score is split into one
+    result per stratum, with the time and the attempt itself shared out by question
+    count, so the paper still adds up to one attempt.
+    """
+    groups = {}
+    for i, origin in enumerate(paper_origins(spec)):
+        groups.setdefault(origin, []).append(i)
+    parts = []
+    for (topic, difficulty), positions in groups.items():
+        score = sum(correctness[i] for i in positions)
+        parts.append(({
+            "student": student,
+            "topic": topic,
+            "difficulty": difficulty,
+            "score": score,
+            "total": len(positions),
+            "percentage": round((score / len(positions)) * 100),
+            "date": date,
+            "time_taken": round(time_taken * len(positions) / len(correctness)),
+            "attempt": len(positions) / len(correctness)
+        }, positions))
+    return parts
+
+def new_quiz(student, spec):
+    """Per-session quiz state: the spec plus one compact answer slot per question (-1 = unanswered)."""
+    return {
+        "student": student,
+        "topic": spec.topic,
+        "difficulty": spec.difficulty,
+        "paper": spec,
+        "answers": array("b", [-1] * len(paper_questions(spec))),
+        "answered": 0,
+        "start_time": datetime.now(),
+        "is_completed": False,
+        "show_results": False
+    }
+
+# --- URL TOKENS (lets a paper be rebuilt after a reconnect) ---
+def encode_paper(spec):
+    # Bank versions are per process, so the token is only good for this bank instance
+    raw = json.dumps([get_question_bank().instance] + list(spec), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def _tupled(value):
+    return tuple(_tupled(v) for v in value) if isinstance(value, list) else value
+
+def _is_int(value, low=0):
+    return isinstance(value, int) and not isinstance(value, bool) and value >= low
+
+def _check_paper(spec, bank):
+    """Raises ValueError unless every field of a decoded spec is well-formed and resolvable."""
+    if not (_is_int(spec.bank_version, 1) and spec.bank_version <= bank.version
+            and _is_int(spec.seed) and _is_int(spec.count, 1) and isinstance(spec.topic, str)):
+        raise ValueError("malformed paper header")
+    if spec.strata is None:
+        if spec.difficulty not in LEVELS or spec.count not in QUESTION_COUNTS:
+            raise ValueError("unknown difficulty or question count")
+        pool = paper_pool(spec)
+        if spec.items is not None:
+            if not (isinstance(spec.items, tuple) and 0 < len(spec.items) <= spec.count
+                    and all(_is_int(i) and i < len(pool) for i in spec.items)
+                    and len(set(spec.items)) == len(spec.items)):
+                raise ValueError("item positions out of range or repeated")
+        if not paper_questions(spec):
+            raise ValueError("empty paper")
+        return
+    if spec.difficulty != "Mixed" or spec.items is not None or len(spec.topic) > MAX_TITLE:
+        raise ValueError("malformed mixed paper")
+    if not isinstance(spec.strata, tuple) or not spec.strata:
+        raise ValueError("malformed strata")
+    topics = set(bank.topics())
+    for stratum in spec.strata:
+        if not (isinstance(stratum, tuple) and len(stratum) == 3 and stratum[0] in topics
+                and stratum[1] in LEVELS and _is_int(stratum[2], 1) and stratum[2] <= MAX_PER_STRATUM):
+            raise ValueError("unknown stratum")
+    if len({stratum[:2] for stratum in spec.strata}) != len(spec.strata):
+        raise ValueError("repeated stratum")
+    if spec.count != sum(n for _, _, n in spec.strata):
+        raise ValueError("count does not match strata")
+    if not paper_questions(spec):
+        raise ValueError("empty paper")
+
+def decode_paper(token):
+    """Returns the PaperSpec in `token`, or None if it is malformed, stale or from another server run."""
+    bank = get_question_bank()
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        if not isinstance(raw, list) or not raw or raw[0] != bank.instance:
+            return None
+        spec = PaperSpec(*(_tupled(f) for f in raw[1:]))
+        _check_paper(spec, bank)
+    except (ValueError, TypeError, IndexError, KeyError):
+        return None
+    return spec
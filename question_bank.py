@@ -0,0 +1,229 @@
+import csv
+import hashlib
+import json
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+BANK_DIR = os.environ.get("QUIZLEARN_BANK_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "question_banks"))
+RELOAD_INTERVAL = float(os.environ.get("QUIZLEARN_BANK_RELOAD_SECONDS", "5"))
+DIFFICULTIES = ("easy", "medium", "hard")
+SNAPSHOTS_KEPT = 4  # old pool versions retained for quizzes pinned to them
+
+class QuestionBankError(ValueError):
+    """A bank file is missing, unreadable or fails schema validation."""
+
+class Question:
+    """Normalized, read-only question; the correct answer is stored as an option index."""
+
+    __slots__ = ("text", "options", "answer", "key")
+
+    def __init__(self, text, options, answer):
+        object.__setattr__(self, "text", text)
+        object.__setattr__(self, "options", options)
+        object.__setattr__(self, "answer", answer)
+        # Content-derived id, stable across reloads and file moves (per-student item stats)
+        digest = hashlib.blake2b("\x1f".join((text,) + options).encode("utf-8"), digest_size=8)
+        object.__setattr__(self, "key", digest.hexdigest())
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Question is read-only")
+
+    @property
+    def correct_option(self):
+        return self.options[self.answer]
+
+    def __repr__(self):
+        return f"Question({self.text!r})"
+
+# --- SCHEMA ---
+def _validate(item, where):
+    if not isinstance(item, dict):
+        raise QuestionBankError(f"{where}: expected an object")
+    text = item.get("question")
+    if not isinstance(text, str) or not text.strip():
+        raise QuestionBankError(f"{where}: 'question' must be a non-empty string")
+    options = item.get("options")
+    if (not isinstance(options, list) or len(options) < 2
+            or not all(isinstance(o, str) and o.strip() for o in options)):
+        raise QuestionBankError(f"{where}: 'options' must list at least two non-empty strings")
+    if len(set(options)) != len(options):
+        raise QuestionBankError(f"{where}: duplicate options")
+    correct = item.get("correct_answer", item.get("correct"))
+    if correct not in options:
+        raise QuestionBankError(f"{where}: correct answer {correct!r} is not one of the options")
+    # Banks use both "correct_answer" and "correct"; normalize to an index once here
+    return Question(text, tuple(options), options.index(correct))
+
+def _read_json(path):
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+def _read_csv(path):
+    """CSV banks: question, correct_answer, option_1 ... option_n columns."""
+    with open(path, encoding="utf-8", newline="") as fh:
+        rows = list(csv.DictReader(fh))
+    return [{
+        "question": row.get("question"),
+        "correct_answer": row.get("correct_answer"),
+        "options": [v for k, v in sorted(row.items()) if k and k.startswith("option_") and v],
+    } for row in rows]
+
+def load_pool(path):
+    """Reads and validates one topic/difficulty file into a tuple of Question records."""
+    try:
+        items = _read_csv(path) if path.endswith(".csv") else _read_json(path)
+    except (OSError, ValueError) as exc:
+        raise QuestionBankError(f"{path}: {exc}") from exc
+    if not isinstance(items, list):
+        raise QuestionBankError(f"{path}: expected a list of questions")
+    return tuple(_validate(item, f"{path}[{i}]") for i, item in enumerate(items))
+
+class FlatIndex:
+    """Every pool of one bank version in a single tuple, with (start, end) offsets per stratum."""
+
+    __slots__ = ("version", "questions", "offsets")
+
+    def __init__(self, version, pools):
+        questions = []
+        self.offsets = {}  # (topic, difficulty) -> (start, end)
+        for key, pool in pools:
+            self.offsets[key] = (len(questions), len(questions) + len(pool))
+            questions.extend(pool)
+        self.version = version
+        self.questions = tuple(questions)
+
+    def stratum(self, topic, difficulty):
+        """Flat positions of one topic/difficulty, as a range (empty if absent)."""
+        return range(*self.offsets.get((topic, difficulty), (0, 0)))
+
+class QuestionBank:
+    """File-backed question banks, loaded lazily per topic/difficulty and hot-reloaded.
+
+    Layout: <root>/<slug>/meta.json ({"topic": ...}) next to easy/medium/hard
+    .json or .csv files. Only file metadata is scanned up front; each pool is
+    parsed the first time it is requested. Any file change bumps `version`, and
+    pools keep a few older snapshots so a quiz pinned to an earlier version can
+    still be served.
+    """
+
+    def __init__(self, root=BANK_DIR, reload_interval=RELOAD_INTERVAL):
+        self.root = root
+        self.reload_interval = reload_interval
+        self.version = 0
+        # `version` restarts at 1 with the process; tokens naming a version carry this too
+        self.instance = secrets.token_hex(4)
+        self._lock = threading.RLock()
+        self._files = {}       # (topic, difficulty) -> path
+        self._signatures = {}  # path -> (mtime_ns, size)
+        self._changed_at = {}  # (topic, difficulty) -> version the file content dates from
+        self._pools = {}       # (topic, difficulty) -> [(since_version, pool), ...] oldest first
+        self._flat = OrderedDict()  # version -> FlatIndex
+        self._last_scan = 0.0
+        self.errors = {}       # (topic, difficulty) or (directory, "meta") -> last reload failure
+        self._scan()
+
+    # --- FILE SCANNING ---
+    def _discover(self):
+        files = {}
+        for entry in sorted(os.scandir(self.root), key=lambda e: e.name):
+            meta_path = os.path.join(entry.path, "meta.json")
+            if not entry.is_dir() or not os.path.exists(meta_path):
+                continue
+            try:
+                meta = _read_json(meta_path)
+                topic = (meta.get("topic") if isinstance(meta, dict) else None) or entry.name
+            except (OSError, ValueError) as exc:
+                # A half-saved meta.json keeps the directory's previous mapping until it is fixed
+                self.errors[(entry.name, "meta")] = f"{meta_path}: {exc}"
+                prefix = entry.path + os.sep
+                files.update((key, path) for key, path in self._files.items() if path.startswith(prefix))
+                continue
+            self.errors.pop((entry.name, "meta"), None)
+            for difficulty in DIFFICULTIES:
+                for ext in (".json", ".csv"):
+                    path = os.path.join(entry.path, difficulty + ext)
+                    if os.path.exists(path):
+                        files[(topic, difficulty)] = path
+                        break
+        return files
+
+    def _scan(self):
+        with self._lock:
+            files = self._discover()
+            signatures = {}
+            for key, path in list(files.items()):
+                try:
+                    stat = os.stat(path)
+                    signatures[path] = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    # removed or being replaced between discovery and stat: keep what we knew, if anything
+                    if path in self._signatures:
+                        signatures[path] = self._signatures[path]
+                    else:
+                        del files[key]
+            if files != self._files or signatures != self._signatures:
+                self.version += 1
+                for key, path in files.items():
+                    if self._files.get(key) != path or self._signatures.get(path) != signatures[path]:
+                        self._changed_at[key] = self.version
+                for key in set(self._changed_at) - set(files):
+                    del self._changed_at[key]
+                self._files = files
+                self._signatures = signatures
+            self._last_scan = time.monotonic()
+
+    def _maybe_reload(self):
+        if time.monotonic() - self._last_scan >= self.reload_interval:
+            self._scan()
+
+    # --- LOOKUPS ---
+    def topics(self):
+        self._maybe_reload()
+        return sorted({topic for topic, _ in self._files})
+
+    def pool(self, topic, difficulty, version=None):
+        """Questions for one topic/difficulty, as of `version` (default: latest)."""
+        self._maybe_reload()
+        key = (topic, difficulty)
+        with self._lock:
+            if version is None and key not in self._files:
+                raise KeyError(f"{topic} / {difficulty} is not in the question bank")
+            snapshots = self._pools.setdefault(key, [])
+            if key in self._files and (not snapshots or snapshots[-1][0] < self._changed_at[key]):
+                try:
+                    pool = load_pool(self._files[key])
+                    self.errors.pop(key, None)
+                except QuestionBankError as exc:
+                    if not snapshots:
+                        raise
+                    # A broken edit keeps serving the last good pool until it is fixed
+                    self.errors[key] = str(exc)
+                    pool = snapshots[-1][1]
+                snapshots.append((self._changed_at[key], pool))
+                del snapshots[:-SNAPSHOTS_KEPT]
+            target = self.version if version is None else version
+            for since, pool in reversed(snapshots):
+                if since <= target:
+                    return pool
+        raise KeyError(f"{topic} / {difficulty} is not available at bank version {target}")
+
+    def flat_index(self, version=None):
+        """Flattened, offset-indexed view of every pool at `version`, built once per version."""
+        self._maybe_reload()
+        with self._lock:
+            target = self.version if version is None else version
+            flat = self._flat.get(target)
+            if flat is None:
+                pools = []
+                for key in sorted(self._files):
+                    try:
+                        pools.append((key, self.pool(*key, version=target)))
+                    except KeyError:
+                        continue
+                flat = self._flat[target] = FlatIndex(target, pools)
+                while len(self._flat) > SNAPSHOTS_KEPT:
+                    self._flat.popitem(last=False)
+            return flat
@@ -0,0 +1,49 @@
+import threading
+from collections import namedtuple
+import streamlit as st
+from storage import get_result_store
+
+Student = namedtuple("Student", "id name")
+LOCK_STRIPES = 16
+
+def normalize_name(name):
+    """Case- and whitespace-insensitive lookup key ("  alice  SMITH" == "Alice Smith")."""
+    return " ".join(name.split()).casefold()
+
+class StudentRegistry:
+    """Hash index of students on normalized names, with ids allocated by the store.
+
+    Lookups are a single lock-free dict read. Inserts take one of a set of
+    striped locks (by name hash) and go through the store's UNIQUE name_key
+    column, so concurrent sessions (or processes) registering the same name
+    always end up with the same id while different names don't contend.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._by_key = {key: Student(sid, name) for sid, name, key in store.student_rows()}
+        self._locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+    def get(self, name):
+        return self._by_key.get(normalize_name(name))
+
+    def register(self, name):
+        """Returns the student for `name`, creating it on first sight."""
+        key = normalize_name(name)
+        student = self._by_key.get(key)
+        if student is not None:
+            return student
+        with self._locks[hash(key) % LOCK_STRIPES]:
+            student = self._by_key.get(key)
+            if student is None:
+                sid, stored_name = self.store.add_student(" ".join(name.split()), key)
+                student = self._by_key[key] = Student(sid, stored_name)
+        return student
+
+    def __len__(self):
+        return len(self._by_key)
+
+@st.cache_resource
+def get_student_registry():
+    """Process-wide student registry shared by every session."""
+    return StudentRegistry(get_result_store())
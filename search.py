@@ -0,0 +1,143 @@
+import heapq
+import math
+import re
+import threading
+import time
+from collections import Counter
+import streamlit as st
+from state import get_question_bank
+from question_bank import DIFFICULTIES
+
+# --- BM25 ---
+K1 = 1.2
+B = 0.75
+MAX_RESULTS = 50
+_TOKEN = re.compile(r"\w+")
+
+def tokenize(text):
+    return _TOKEN.findall(text.casefold())
+
+class Segment:
+    """Postings for one topic/difficulty pool, rebuilt only when that pool changes."""
+
+    __slots__ = ("pool", "postings", "lengths", "df")
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.postings = {}  # term -> [(position, term frequency), ...]
+        self.lengths = []
+        for pos, q in enumerate(pool):
+            tokens = tokenize(" ".join((q.text,) + q.options))
+            self.lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                self.postings.setdefault(term, []).append((pos, tf))
+        self.df = {term: len(postings) for term, postings in self.postings.items()}
+
+class QuestionIndex:
+    """In-memory inverted index over question text and options, ranked with BM25.
+
+    The index is a set of per-pool segments plus corpus-wide document
+    frequencies. sync() follows the bank's version: only pools whose content
+    changed are re-tokenized, and their old document frequencies are swapped
+    out for the new ones. Each sync publishes a fresh snapshot, so searches
+    never see a half-updated index.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = (None, {}, {}, 0, 0)  # (version, segments, df, docs, total length)
+
+    def sync(self, bank):
+        flat = bank.flat_index()
+        if self._snapshot[0] == flat.version:
+            return
+        with self._lock:
+            version, segments, df, docs, total = self._snapshot
+            if version == flat.version:
+                return
+            segments, df = dict(segments), dict(df)
+            for key in set(segments) - set(flat.offsets):
+                docs, total = self._retire(segments.pop(key), df, docs, total)
+            for key in flat.offsets:
+                pool = bank.pool(*key, version=flat.version)
+                if key in segments and segments[key].pool is pool:
+                    continue
+                if key in segments:
+                    docs, total = self._retire(segments[key], df, docs, total)
+                segment = segments[key] = Segment(pool)
+                for term, n in segment.df.items():
+                    df[term] = df.get(term, 0) + n
+                docs += len(segment.lengths)
+                total += sum(segment.lengths)
+            self._snapshot = (flat.version, segments, df, docs, total)
+
+    @staticmethod
+    def _retire(segment, df, docs, total):
+        for term, n in segment.df.items():
+            df[term] -= n
+            if not df[term]:
+                del df[term]
+        return docs - len(segment.lengths), total - sum(segment.lengths)
+
+    def search(self, query, topic=None, difficulty=None, limit=MAX_RESULTS):
+        """Top (score, topic, difficulty, position, question) hits, optionally filtered."""
+        _, segments, df, docs, total = self._snapshot
+        terms = [t for t in dict.fromkeys(tokenize(query)) if t in df]
+        if not terms or not docs:
+            return []
+        avg_len = total / docs
+        idf = {t: math.log(1 + (docs - df[t] + 0.5) / (df[t] + 0.5)) for t in terms}
+        scores = {}
+        for (seg_topic, seg_difficulty), segment in segments.items():
+            if (topic and seg_topic != topic) or (difficulty and seg_difficulty != difficulty):
+                continue
+            for term in terms:
+                for pos, tf in segment.postings.get(term, ()):
+                    norm = K1 * (1 - B + B * segment.lengths[pos] / avg_len)
+                    key = (seg_topic, seg_difficulty, pos)
+                    scores[key] = scores.get(key, 0.0) + idf[term] * tf * (K1 + 1) / (tf + norm)
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [(score, t, d, pos, segments[(t, d)].pool[pos]) for (t, d, pos), score in best]
+
+    def __len__(self):
+        return self._snapshot[3]
+
+@st.cache_resource
+def get_question_index():
+    """Process-wide question index, kept in step with the bank on each search."""
+    return QuestionIndex()
+
+def question_search():
+    st.markdown("## Question Search")
+
+    bank = get_question_bank()
+    index = get_question_index()
+    index.sync(bank)
+
+    st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+    query = st.text_input("Search questions and options", placeholder="e.g. graph traversal")
+    c1, c2 = st.columns([2, 1])
+    with c1:
+        topic = st.selectbox("Subject", [None] + bank.topics(), format_func=lambda t: t or "All Subjects")
+    with c2:
+        difficulty = st.selectbox("Difficulty", [None] + list(DIFFICULTIES),
+                                  format_func=lambda d: d.title() if d else "All Levels")
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    if not query.strip():
+        st.caption(f"{len(index)} questions indexed (bank version {bank.version})")
+        return
+
+    started = time.perf_counter()
+    hits = index.search(query, topic, difficulty)
+    elapsed = (time.perf_counter() - started) * 1000
+    st.caption(f"{len(hits)} results in {elapsed:.1f} ms across {len(index)} questions"
+               + (f" (top {MAX_RESULTS} shown)" if len(hits) == MAX_RESULTS else ""))
+
+    for score, hit_topic, hit_difficulty, pos, q in hits:
+        options = " · ".join(f"**{o}**" if i == q.answer else o for i, o in enumerate(q.options))
+        st.markdown(
+            f"**{q.text}**  \n{options}  \n"
+            f"<small>{hit_topic} / {hit_difficulty.title()} #{pos + 1} · score {score:.2f}</small>",
+            unsafe_allow_html=True
+        )
@@ -0,0 +1,148 @@
+import math
+import random
+from array import array
+import threading
+import time
+from collections import OrderedDict
+import streamlit as st
+from storage import get_result_store
+from papers import PaperSpec, paper_items, paper_pool
+
+# --- SPACED-REPETITION WEIGHTING ---
+MIN_WEIGHT = 0.05           # mastered items still turn up occasionally
+BASE_INTERVAL = 86_400.0    # seconds an item stays "fresh" after one correct answer
+SAMPLER_TTL = 3_600.0       # weights drift with time, so samplers are rebuilt hourly
+SAMPLER_ITEMS_KEPT = 4_000_000  # pool positions across all cached samplers (~64 MB of doubles)
+
+def item_weight(stats, now):
+    """1 + MIN_WEIGHT for unseen or last-missed items, decaying towards MIN_WEIGHT
+    right after a correct answer; each correct streak doubles the recall interval."""
+    if stats is None:
+        return 1.0 + MIN_WEIGHT
+    seen, correct, streak, last_seen = stats
+    if streak == 0:
+        return 1.0 + MIN_WEIGHT
+    interval = BASE_INTERVAL * 2 ** (streak - 1)
+    recall = math.exp(-max(now - last_seen, 0.0) / interval)
+    return MIN_WEIGHT + (1.0 - recall)
+
+class WeightedSampler:
+    """Fenwick tree over item weights: O(log n) weight updates and O(log n) draws."""
+
+    def __init__(self, weights):
+        # flat C doubles: 16 bytes per item for weights + tree, instead of boxed floats
+        self._weights = array("d", weights)
+        self._n = len(self._weights)
+        self._tree = array("d", bytes(8 * (self._n + 1)))
+        for i, w in enumerate(self._weights, 1):
+            self._tree[i] += w
+            parent = i + (i & -i)
+            if parent <= self._n:
+                self._tree[parent] += self._tree[i]
+        self._top = 1 << (self._n.bit_length() - 1) if self._n else 0
+        self.built_at = time.time()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return self._n
+
+    def update(self, i, weight):
+        delta = weight - self._weights[i]
+        self._weights[i] = weight
+        i += 1
+        while i <= self._n:
+            self._tree[i] += delta
+            i += i & -i
+
+    def total(self):
+        total, i = 0.0, self._n
+        while i:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _find(self, target):
+        """Smallest index whose prefix sum exceeds target (descends the tree)."""
+        pos, step = 0, self._top
+        while step:
+            nxt = pos + step
+            if nxt <= self._n and self._tree[nxt] <= target:
+                pos = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        return min(pos, self._n - 1)
+
+    def draw(self, k, rng):
+        """k distinct indices, each drawn proportionally to weight: O(k log n)."""
+        picks, saved = [], []
+        for _ in range(min(k, self._n)):
+            total = self.total()
+            if total <= 0:
+                break
+            i = self._find(rng.random() * total)
+            if self._weights[i] <= 0:
+                # float rounding landed on an exhausted slot; fall back to the last live one
+                i = max(j for j in range(self._n) if self._weights[j] > 0)
+            picks.append(i)
+            saved.append(self._weights[i])
+            self.update(i, 0.0)
+        for i, w in zip(picks, saved):
+            self.update(i, w)
+        return picks
+
+class AdaptiveSelector:
+    """Per-student samplers over each pool, built once and updated in place on submit.
+
+    The cache is bounded by the total number of pool positions held, so a few
+    huge pools and many small ones cost the same memory budget.
+    """
+
+    def __init__(self, store, max_items=SAMPLER_ITEMS_KEPT):
+        self.store = store
+        self.max_items = max_items
+        self._samplers = OrderedDict()  # (student, topic, difficulty, bank_version) -> WeightedSampler
+        self._items = 0
+        self._lock = threading.Lock()
+
+    def _sampler(self, student, spec):
+        key = (student, spec.topic, spec.difficulty, spec.bank_version)
+        with self._lock:
+            sampler = self._samplers.get(key)
+            if sampler is not None and time.time() - sampler.built_at < SAMPLER_TTL:
+                self._samplers.move_to_end(key)
+                return sampler
+        stats = self.store.item_stats(student)
+        now = time.time()
+        sampler = WeightedSampler([item_weight(stats.get(q.key), now) for q in paper_pool(spec)])
+        with self._lock:
+            old = self._samplers.pop(key, None)
+            self._items += len(sampler) - (len(old) if old is not None else 0)
+            self._samplers[key] = sampler
+            while self._items > self.max_items and len(self._samplers) > 1:
+                self._items -= len(self._samplers.popitem(last=False)[1])
+        return sampler
+
+    def new_paper(self, bank, student, topic, difficulty, count):
+        seed = random.getrandbits(32)
+        spec = PaperSpec(bank.version, topic, difficulty, seed, count)
+        sampler = self._sampler(student, spec)
+        with sampler.lock:
+            items = sampler.draw(count, random.Random(seed))
+        return spec._replace(items=tuple(items))
+
+    def record(self, student, spec, correctness):
+        """Feeds one submitted paper back into the cached sampler, if there is one."""
+        key = (student, spec.topic, spec.difficulty, spec.bank_version)
+        with self._lock:
+            sampler = self._samplers.get(key)
+        if sampler is None:
+            return
+        with sampler.lock:
+            for i, ok in zip(paper_items(spec), correctness):
+                # just answered: recall is 1 if right, 0 if wrong
+                sampler.update(i, MIN_WEIGHT if ok else 1.0 + MIN_WEIGHT)
+
+@st.cache_resource
+def get_adaptive_selector():
+    """Process-wide adaptive selector shared by every session."""
+    return AdaptiveSelector(get_result_store())
@@ -0,0 +1,167 @@
+import bisect
+import threading
+from datetime import date, datetime
+from functools import lru_cache
+import streamlit as st
+from storage import get_result_store
+
+class Standings:
+    """Running per-student score/question/attempt totals with an ordered index for ranked, paginated reads.
+
+    A student's average is their score over every question answered, so a long
+    paper weighs more than a short one; attempts may be fractional, since each
+    stratum of a mixed paper carries its share of that one attempt.
+
+    Writers serialize on a lock and then publish an immutable snapshot of the
+    ordering; readers only ever touch the latest published snapshot, so a
+    burst of submissions never waits on Hall of Fame renders (or vice versa).
+    Alongside the ordering it keeps the sorted distinct averages, so a dense
+    rank (ties share a rank, no gaps) is one binary search.
+    """
+
+    def __init__(self):
+        self._totals = {}   # student -> (score sum, questions, attempts)
+        self._order = []    # sorted (-average, student, attempts), best first
+        self._distinct = [] # sorted distinct -average values
+        self._ties = {}     # -average -> students currently on it
+        self._snapshot = ((), ())
+        self._lock = threading.Lock()
+
+    def _key(self, student):
+        score, questions, attempts = self._totals[student]
+        # -(x) rather than -x / n: negating 0.0 back for display must give 0.0, not -0.0
+        return (-(100 * score / questions), student, attempts)
+
+    def _fold(self, student, score, questions, attempts):
+        if student in self._totals:
+            old = self._key(student)
+            del self._order[bisect.bisect_left(self._order, old)]
+            self._ties[old[0]] -= 1
+            if not self._ties[old[0]]:
+                del self._ties[old[0]]
+                del self._distinct[bisect.bisect_left(self._distinct, old[0])]
+            total, count, taken = self._totals[student]
+        else:
+            total, count, taken = 0, 0, 0
+        self._totals[student] = (total + score, count + questions, taken + attempts)
+        new = self._key(student)
+        bisect.insort(self._order, new)
+        if new[0] not in self._ties:
+            self._ties[new[0]] = 0
+            bisect.insort(self._distinct, new[0])
+        self._ties[new[0]] += 1
+
+    def add(self, student, score, questions, attempts=1):
+        """Folds one submission (or a pre-aggregated batch) into the running totals."""
+        self.add_many([(student, score, questions, attempts)])
+
+    def add_many(self, rows):
+        """Folds (student, score sum, questions, attempts) rows and publishes one new snapshot."""
+        with self._lock:
+            for student, score, questions, attempts in rows:
+                self._fold(student, score, questions, attempts)
+            self._snapshot = (tuple(self._order), tuple(self._distinct))
+
+    def top(self, k):
+        """(student, average, attempts) for the k best students."""
+        return [(student, -neg_avg, count) for neg_avg, student, count in self._snapshot[0][:k]]
+
+    def page(self, number, size, search=""):
+        """One page of (rank, student, average, attempts) rows and the number of matching students.
+
+        Ranks are dense over the whole board, so a name search still shows each
+        student's real position.
+        """
+        order, distinct = self._snapshot
+        if search:
+            needle = search.casefold()
+            order = [row for row in order if needle in row[1].casefold()]
+        start = number * size
+        rows = [(bisect.bisect_left(distinct, neg_avg) + 1, student, -neg_avg, count)
+                for neg_avg, student, count in order[start:start + size]]
+        return rows, len(order)
+
+    def __contains__(self, student):
+        return student in self._totals
+
+    def __len__(self):
+        return len(self._snapshot[0])
+
+# --- ROLLUPS (topic x difficulty x time window) ---
+ALL = None
+WINDOWS = ("All Time", "This Month", "This Week")
+_EMPTY = Standings()
+
+@lru_cache(maxsize=4096)
+def _periods(day):
+    """Window keys a "%Y-%m-%d" day falls in: (None, month, ISO week)."""
+    d = date.fromisoformat(day)
+    year, week, _ = d.isocalendar()
+    return (None, ("month", d.year, d.month), ("week", year, week))
+
+def _current_periods(now=None):
+    return _periods((now or datetime.now()).strftime("%Y-%m-%d"))
+
+class Rollups:
+    """One Standings board per (topic, difficulty, window period), all kept current on submit.
+
+    Every result lands on the overall, per-topic, per-difficulty and
+    per-topic-and-difficulty boards for all time, its month and its ISO week.
+    Boards for months and weeks that have ended are dropped as new ones open.
+    """
+
+    def __init__(self):
+        self._boards = {}   # (topic, difficulty, period) -> Standings
+        self._topics = set()
+        self._difficulties = set()
+        self._lock = threading.Lock()
+
+    def add_many(self, rows, now=None):
+        """Folds (student, topic, difficulty, date, score sum, questions, attempts) rows.
+
+        Rows from months or weeks other than the current ones only count towards
+        the all-time boards.
+        """
+        current = _current_periods(now)
+        batches = {}
+        for student, topic, difficulty, when, score, questions, attempts in rows:
+            periods = _periods(when[:10])
+            for window, period in enumerate(periods):
+                if period != current[window]:
+                    continue
+                for t in (ALL, topic):
+                    for d in (ALL, difficulty):
+                        batches.setdefault((t, d, period), []).append((student, score, questions, attempts))
+        with self._lock:
+            for key in [k for k in self._boards if k[2] is not None and k[2] not in current]:
+                del self._boards[key]
+            boards = [(self._boards.setdefault(key, Standings()), batch) for key, batch in batches.items()]
+            self._topics.update(key[0] for key in batches if key[0] is not None)
+            self._difficulties.update(key[1] for key in batches if key[1] is not None)
+        for board, batch in boards:
+            board.add_many(batch)
+
+    def add(self, result):
+        self.add_many([(result["student"], result["topic"], result["difficulty"],
+                        result["date"], result["score"], result["total"], result.get("attempt", 1))])
+
+    def board(self, topic=ALL, difficulty=ALL, window="All Time", now=None):
+        """The Standings for one slice (an empty board if nobody has a result in it yet)."""
+        period = _current_periods(now)[WINDOWS.index(window)]
+        return self._boards.get((topic, difficulty, period), _EMPTY)
+
+    def topics(self):
+        return sorted(self._topics)
+
+    def difficulties(self):
+        return sorted(self._difficulties)
+
+@st.cache_resource
+def get_rollups():
+    """Process-wide leaderboard rollups, seeded once from the result store then kept current on submit."""
+    # Building the write queue first replays any spooled submissions into the store
+    from submissions import get_write_queue
+    get_write_queue()
+    rollups = Rollups()
+    rollups.add_many(get_result_store().rollup_totals())
+    return rollups
@@ -0,0 +1,201 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+import streamlit as st
+
+DB_PATH = os.environ.get("QUIZLEARN_DB", "quizlearn.db")
+
+_MAX_ID = 2 ** 63 - 1
+POOL_SIZE = 4   # idle connections kept open for reuse across script runs
+
+RESULT_COLUMNS = ["student", "topic", "difficulty", "score", "total", "percentage", "date", "time_taken"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    student TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    percentage INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    time_taken INTEGER NOT NULL,
+    attempt REAL NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_results_student_date ON results (student, date);
+CREATE INDEX IF NOT EXISTS idx_results_topic_date ON results (topic, date);
+CREATE INDEX IF NOT EXISTS idx_results_date ON results (date);
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS item_stats (
+    student TEXT NOT NULL,
+    item_key TEXT NOT NULL,
+    seen INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    streak INTEGER NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (student, item_key)
+) WITHOUT ROWID;
+"""
+
+class ResultStore:
+    """Durable quiz results in SQLite (WAL mode), behind a small pool of shared connections.
+
+    Streamlit runs every rerun on a fresh thread, so connections are checked out
+    per call rather than kept per thread; a rerun reuses an idle one instead of
+    reconnecting and re-issuing the PRAGMAs.
+    """
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self._idle = queue.LifoQueue()
+        self._versions = {}  # student -> count of batches written since startup
+        self._versions_lock = threading.Lock()
+        with self._connection() as conn, conn:
+            conn.executescript(SCHEMA)
+            # databases created before results carried an attempt share
+            if "attempt" not in {row[1] for row in conn.execute("PRAGMA table_info(results)")}:
+                conn.execute("ALTER TABLE results ADD COLUMN attempt REAL NOT NULL DEFAULT 1")
+
+    def _open(self):
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        # WAL lets every reader run alongside the single writer
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _connection(self):
+        """Checks out an idle connection (opening one if all are busy) and returns it afterwards."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._open()
+        try:
+            yield conn
+        finally:
+            if self._idle.qsize() < POOL_SIZE:
+                self._idle.put(conn)
+            else:
+                conn.close()
+
+    # --- WRITES ---
+    def add_results(self, results, item_outcomes=()):
+        """Inserts a batch of result dicts, plus their per-question outcomes, in one transaction.
+
+        item_outcomes are (student, item_key, was_correct, when) rows upserted into item_stats.
+        A result's optional "attempt" is the share of its paper it covers (1 for a whole paper).
+        """
+        rows = [tuple(r[col] for col in RESULT_COLUMNS) + (r.get("attempt", 1),) for r in results]
+        outcome_rows = [(student, key, int(ok), int(ok), when) for student, key, ok, when in item_outcomes]
+        if not rows and not outcome_rows:
+            return
+        with self._connection() as conn, conn:
+            conn.executemany(
+                f"INSERT INTO results ({', '.join(RESULT_COLUMNS)}, attempt) "
+                f"VALUES ({', '.join('?' for _ in RESULT_COLUMNS)}, ?)",
+                rows
+            )
+            conn.executemany(
+                "INSERT INTO item_stats (student, item_key, seen, correct, streak, last_seen) "
+                "VALUES (?, ?, 1, ?, ?, ?) "
+                "ON CONFLICT (student, item_key) DO UPDATE SET "
+                "seen = seen + 1, correct = correct + excluded.correct, "
+                "streak = CASE WHEN excluded.correct THEN streak + 1 ELSE 0 END, "
+                "last_seen = excluded.last_seen",
+                outcome_rows
+            )
+        with self._versions_lock:
+            for student in {r["student"] for r in results}:
+                self._versions[student] = self._versions.get(student, 0) + 1
+
+    def add_student(self, name, name_key):
+        """Registers a student once; returns the (id, name) row, which never changes afterwards."""
+        with self._connection() as conn:
+            with conn:
+                conn.execute("INSERT OR IGNORE INTO students (name, name_key) VALUES (?, ?)", (name, name_key))
+            return conn.execute("SELECT id, name FROM students WHERE name_key = ?", (name_key,)).fetchone()
+
+    def history_version(self, student):
+        """Changes whenever new results land for the student; used as a cache key."""
+        return self._versions.get(student, 0)
+
+    # --- READS (all served by the indexes above) ---
+    def _query(self, sql, params=()):
+        with self._connection() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def has_results(self):
+        return bool(self._query("SELECT 1 FROM results LIMIT 1"))
+
+    def snapshot(self):
+        """Id of the newest committed result. Results are append-only, so passing it as
+        `upto` gives readers on any thread or connection the same consistent view
+        without holding a transaction open or blocking writers."""
+        return self._query("SELECT COALESCE(MAX(id), 0) FROM results")[0][0]
+
+    def students(self, upto=None):
+        rows = self._query(
+            "SELECT DISTINCT student FROM results WHERE id <= ? ORDER BY student",
+            (_MAX_ID if upto is None else upto,)
+        )
+        return [r[0] for r in rows]
+
+    def results_for(self, student, upto=None):
+        """Rows (in RESULT_COLUMNS order) for one student, oldest first.
+
+        `upto` caps the result id, pinning reads to a snapshot() taken earlier.
+        """
+        return self._query(
+            f"SELECT {', '.join(RESULT_COLUMNS)} FROM results WHERE student = ? AND id <= ? ORDER BY date, id",
+            (student, _MAX_ID if upto is None else upto)
+        )
+
+    def student_rows(self):
+        return self._query("SELECT id, name, name_key FROM students")
+
+    def item_stats(self, student):
+        """item_key -> (seen, correct, streak, last_seen) for one student."""
+        rows = self._query(
+            "SELECT item_key, seen, correct, streak, last_seen FROM item_stats WHERE student = ?",
+            (student,)
+        )
+        return {row[0]: row[1:] for row in rows}
+
+    def iter_results(self, chunk_size=50_000, upto=None):
+        """Streams every result in insertion order, chunk_size rows at a time.
+
+        The connection stays checked out until the stream is exhausted or closed.
+        """
+        with self._connection() as conn:
+            cursor = conn.execute(
+                f"SELECT {', '.join(RESULT_COLUMNS)} FROM results WHERE id <= ? ORDER BY id",
+                (_MAX_ID if upto is None else upto,)
+            )
+            try:
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        return
+                    yield rows
+            finally:
+                # an abandoned stream must not leave a read open on a pooled connection
+                cursor.close()
+
+    def rollup_totals(self):
+        """(student, topic, difficulty, day, score sum, question count, attempts) per student, slice and day."""
+        return self._query(
+            "SELECT student, topic, difficulty, substr(date, 1, 10), SUM(score), SUM(total), SUM(attempt) "
+            "FROM results GROUP BY student, topic, difficulty, substr(date, 1, 10)"
+        )
+
+@st.cache_resource
+def get_result_store():
+    """Process-wide result store shared by every session."""
+    return ResultStore()
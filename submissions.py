@@ -0,0 +1,184 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import streamlit as st
+from storage import get_result_store
+from standings import get_rollups
+from cache import get_analytics_cache
+from selection import get_adaptive_selector
+
+QUEUE_SIZE = 5_000       # submissions buffered before submitters feel backpressure
+BATCH_SIZE = 500         # results written per transaction
+FLUSH_INTERVAL = 0.25    # seconds the worker waits to fill a batch
+PUT_TIMEOUT = 2.0        # how long a submit may block on a full queue
+RETRY_DELAYS = (0.1, 0.5, 2.0)  # backoff between attempts at a failing batch
+SPOOL_PATH = os.environ.get("QUIZLEARN_SPOOL", "quizlearn.spool.jsonl")
+
+_STOP = object()
+log = logging.getLogger(__name__)
+
+class WriteBehindQueue:
+    """Bounded in-process queue of submissions, drained in batches by one background writer.
+
+    submit() returns as soon as the submission is queued. When the queue is full
+    it blocks for up to PUT_TIMEOUT and then writes synchronously, so a backlog
+    slows submitters down instead of growing without bound. close() (registered
+    with atexit) drains whatever is left before the process exits.
+
+    A failing batch is retried with backoff, then written row by row so one bad
+    row can't sink the rest; whatever still fails is appended to a spool file,
+    which the next queue replays as it is built, before it takes any submissions.
+    """
+
+    def __init__(self, store, on_written=None, maxsize=QUEUE_SIZE, spool_path=SPOOL_PATH):
+        self.store = store
+        self.on_written = on_written
+        self.spool_path = spool_path
+        self._spool_lock = threading.Lock()
+        self._queue = queue.Queue(maxsize)
+        self._closed = False
+        # replayed synchronously, so readers seeded from the store afterwards see these rows
+        try:
+            self._replay_spool()
+        except Exception:
+            log.exception("result-writer: could not replay %s", self.spool_path)
+        self._worker = threading.Thread(target=self._drain, name="result-writer", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def submit(self, result, item_outcomes):
+        entry = (result, item_outcomes)
+        if not self._closed:
+            try:
+                self._queue.put(entry, timeout=PUT_TIMEOUT)
+                return
+            except queue.Full:
+                pass
+        self._write([entry])
+
+    def flush(self):
+        """Blocks until everything queued so far is on disk."""
+        self._queue.join()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._worker.join()
+
+    def __len__(self):
+        return self._queue.qsize()
+
+    # --- WORKER ---
+    def _store(self, batch):
+        results = [result for result, _ in batch]
+        self.store.add_results(results, [row for _, outcomes in batch for row in outcomes])
+        return results
+
+    def _write(self, batch):
+        """Stores a batch, retrying with backoff, then row by row; rows that still fail are spooled."""
+        for delay in RETRY_DELAYS + (None,):
+            try:
+                written = self._store(batch)
+                break
+            except Exception:
+                if delay is None:
+                    log.exception("result-writer: batch of %d failed after retries, writing row by row", len(batch))
+                    written = self._write_rows(batch)
+                    break
+                log.warning("result-writer: batch of %d failed, retrying in %.1fs", len(batch), delay, exc_info=True)
+                time.sleep(delay)
+        if written and self.on_written is not None:
+            self.on_written(written)
+
+    def _write_rows(self, batch):
+        written, failed = [], []
+        for entry in batch:
+            try:
+                written.extend(self._store([entry]))
+            except Exception:
+                failed.append(entry)
+        if failed:
+            self._spool(failed)
+        return written
+
+    def _spool(self, entries):
+        lines = "".join(json.dumps([result, list(outcomes)]) + "\n" for result, outcomes in entries)
+        try:
+            with self._spool_lock, open(self.spool_path, "a", encoding="utf-8") as fh:
+                fh.write(lines)
+            log.error("result-writer: spooled %d unwritable submissions to %s", len(entries), self.spool_path)
+        except OSError:
+            # last resort: the submissions survive in the log
+            log.critical("result-writer: could not spool submissions, contents follow\n%s", lines)
+
+    def _replay_spool(self):
+        """Retries submissions spooled by an earlier run; anything still failing is spooled again."""
+        replaying = self.spool_path + ".replay"
+        try:
+            with self._spool_lock:
+                os.replace(self.spool_path, replaying)
+        except FileNotFoundError:
+            return
+        with open(replaying, encoding="utf-8") as fh:
+            entries = [(result, [tuple(o) for o in outcomes]) for result, outcomes in map(json.loads, filter(str.strip, fh))]
+        log.info("result-writer: replaying %d spooled submissions", len(entries))
+        for start in range(0, len(entries), BATCH_SIZE):
+            self._write(entries[start:start + BATCH_SIZE])
+        os.remove(replaying)
+
+    def _drain(self):
+        while True:
+            entry = self._queue.get()
+            batch, stop = [], entry is _STOP
+            if not stop:
+                batch.append(entry)
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while not stop and len(batch) < BATCH_SIZE:
+                try:
+                    entry = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stop = True
+                else:
+                    batch.append(entry)
+            try:
+                if batch:
+                    self._write(batch)
+            except Exception:
+                # _write spools what it can't store; this only guards the writer thread itself
+                log.exception("result-writer: unexpected error handling a batch of %d submissions", len(batch))
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+            if stop:
+                return
+
+def _invalidate_analytics(results):
+    cache = get_analytics_cache()
+    for student in {r["student"] for r in results}:
+        cache.invalidate(student)
+
+@st.cache_resource
+def get_write_queue():
+    """Process-wide write-behind queue in front of the result store."""
+    return WriteBehindQueue(get_result_store(), on_written=_invalidate_analytics)
+
+def submit_result(parts, paper, questions, correctness):
+    """Records a finished paper: in-memory views update now, storage catches up in the background.
+
+    parts are (result, question positions) pairs, one per topic/difficulty the paper covered.
+    """
+    when = time.time()
+    for result, positions in parts:
+        outcomes = [(result["student"], questions[i].key, correctness[i], when) for i in positions]
+        get_write_queue().submit(result, outcomes)
+        get_rollups().add(result)
+    if parts:
+        get_adaptive_selector().record(parts[0][0]["student"], paper, correctness)
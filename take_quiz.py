@@ -1,6 +1,86 @@
 import streamlit as st
 import random
 from datetime import datetime
+from state import get_question_bank
+from question_bank import QuestionBankError
+from registry import get_student_registry
+from submissions import submit_result
+from theme import DIFFICULTY_COLORS
+from selection import get_adaptive_selector
+from metrics import timed
+from papers import QUESTION_COUNTS, MAX_PER_STRATUM, new_paper, new_mixed_paper, new_quiz, paper_questions, paper_results, encode_paper, decode_paper
+
+def _answer_key(quiz, i):
+    # Seeded keys: widgets from a finished paper are dropped by Streamlit, no manual cleanup
+    return f"q_{quiz['paper'].seed}_{i}"
+
+def _record_answer(quiz, i):
+    """Radio on_change callback: updates the answers array and answered counter."""
+    user_ans = st.session_state.get(_answer_key(quiz, i))
+    user_ans = -1 if user_ans is None else user_ans
+    quiz["answered"] += (user_ans >= 0) - (quiz["answers"][i] >= 0)
+    quiz["answers"][i] = user_ans
+
+def _render_progress(quiz):
+    diff_accent = DIFFICULTY_COLORS.get(quiz['difficulty'], "#ffffff")
+    total_questions = len(quiz["answers"])
+    answered_count = quiz["answered"]
+
+    st.markdown(
+        f'<p style="font-size: 1.4rem; font-weight: 700; margin-top: -15px; margin-bottom: 10px; letter-spacing: -0.5px;">'
+        f'<span style="color: {diff_accent};">{quiz["difficulty"]} Mode</span>, '
+        f'<span style="opacity: 0.9;">{answered_count}/{total_questions}</span>'
+        f'</p>', 
+        unsafe_allow_html=True
+    )
+
+    # Bar colour comes from the compiled theme, keyed by difficulty
+    with st.container(key=f"progress_{quiz['difficulty'].lower()}"):
+        st.progress(answered_count / total_questions)
+
+def _render_question(quiz, i):
+    q = paper_questions(quiz["paper"])[i]
+    user_ans = quiz["answers"][i]
+
+    anim_class = ""
+    if quiz["show_results"]:
+        anim_class = "correct-pulse" if user_ans == q.answer else "wrong-shake"
+
+    st.markdown(f'<div class="custom-card {anim_class}">', unsafe_allow_html=True)
+    st.markdown(f"**Question {i+1}**")
+
+    # Widget value is the option index, so grading is an integer comparison
+    st.radio(
+        q.text, 
+        range(len(q.options)), 
+        format_func=q.options.__getitem__,
+        key=_answer_key(quiz, i), 
+        index=None, 
+        disabled=quiz["show_results"],
+        on_change=_record_answer,
+        args=(quiz, i)
+    )
+
+    if quiz["show_results"]:
+        if user_ans == q.answer:
+            st.success("Correct!")
+        else:
+            st.error(f"Incorrect. The right answer was: {q.correct_option}")
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@st.fragment
+@timed("quiz.body_fragment")
+def _render_quiz_body(quiz):
+    """Counter plus question cards: answering reruns only this fragment, so the counter
+    stays current without polling and without rerunning the rest of the page."""
+    _render_progress(quiz)
+    for i in range(len(quiz["answers"])):
+        _render_question(quiz, i)
+
+def _start_quiz(name, spec):
+    st.session_state.current_quiz = new_quiz(name, spec)
+    st.query_params["paper"] = encode_paper(spec)
+    st.rerun()
 
 def take_quiz():
     # Retrieve the dynamic accent color from session state (defined in app.py)
@@ -38,7 +118,9 @@ def take_quiz():
             )
             return
         
-        st.session_state.active_student = name_input
+        student = get_student_registry().register(name_input)
+        st.session_state.active_student = student.name
+        st.session_state.student_id = student.id
         
         all_greetings = ["Welcome", "Great to see you", "Greetings", "Good luck today", "Ready to learn"]
         if "greeting_pool" not in st.session_state or not st.session_state.greeting_pool:
@@ -47,9 +129,6 @@ def take_quiz():
         
         st.session_state.current_greeting = st.session_state.greeting_pool.pop(0)
         
-        if not any(s["name"] == name_input for s in st.session_state.students):
-            st.session_state.students.append({"id": len(st.session_state.students)+1, "name": name_input})
-        
         st.rerun()
 
     # --- STEP 2: DISPLAY LOCKED NAME ---
@@ -63,7 +142,9 @@ def take_quiz():
     with c2:
         if st.button("Logout", use_container_width=True):
             del st.session_state.active_student
+            st.session_state.pop("student_id", None)
             st.session_state.current_quiz = None 
+            st.query_params.pop("paper", None)
             st.rerun()
     st.markdown('</div>', unsafe_allow_html=True)
 
@@ -71,32 +152,69 @@ def take_quiz():
     quiz = st.session_state.get("current_quiz", None)
 
     if quiz is None:
+        # Rebuild a paper that was open before a reconnect
+        token = st.query_params.get("paper")
+        spec = decode_paper(token) if token else None
+        if spec is not None:
+            try:
+                st.session_state.current_quiz = new_quiz(name, spec)
+            except (KeyError, TypeError, ValueError, IndexError, AttributeError):
+                spec = None
+            else:
+                st.rerun()
+        if token and spec is None:
+            # unusable token (tampered, stale or from before a restart): drop it so reruns don't retry it
+            st.query_params.pop("paper", None)
+
+        bank = get_question_bank()
         st.markdown('<div class="custom-card">', unsafe_allow_html=True)
         st.markdown("### Configure Session")
-        c1, c2, c3 = st.columns([2, 1, 1])
-        with c1:
-            topic = st.selectbox("Select Subject", sorted(st.session_state.questions.keys()))
-        with c2:
-            diff = st.selectbox("Select Difficulty", ["Easy", "Medium", "Hard"])
-        with c3:
-            count = st.select_slider("Question Count", options=[1, 3, 5, 10])
-            
-        if st.button("Initialize Assessment"):
-            pool = st.session_state.questions[topic][diff.lower()]
-            selected = random.sample(pool, min(count, len(pool)))
-            st.session_state.current_quiz = {
-                "student": name,
-                "topic": topic,
-                "difficulty": diff,
-                "questions": selected,
-                "answers": {},
-                "start_time": datetime.now(),
-                "is_completed": False,
-                "show_results": False 
+        paper_type = st.radio("Paper Type", ["Single Subject", "Mixed Paper"], horizontal=True)
+
+        if paper_type == "Single Subject":
+            c1, c2, c3 = st.columns([2, 1, 1])
+            with c1:
+                topic = st.selectbox("Select Subject", bank.topics())
+            with c2:
+                diff = st.selectbox("Select Difficulty", ["Easy", "Medium", "Hard"])
+            with c3:
+                count = st.select_slider("Question Count", options=QUESTION_COUNTS)
+            adaptive = st.toggle("Adaptive selection (favour questions you haven't mastered yet)")
+
+            if st.button("Initialize Assessment"):
+                try:
+                    pool = bank.pool(topic, diff.lower())
+                except (KeyError, QuestionBankError) as exc:
+                    st.error(f"This question set is unavailable right now: {exc}")
+                    pool = ()
+                if pool:
+                    if adaptive:
+                        spec = get_adaptive_selector().new_paper(bank, name, topic, diff, count)
+                    else:
+                        spec = new_paper(bank, topic, diff, count)
+                    _start_quiz(name, spec)
+        else:
+            # Stratified paper: the same per-difficulty quota from every chosen subject
+            title = st.text_input("Paper Title", value="Midterm")
+            subjects = st.multiselect("Subjects", bank.topics())
+            q1, q2, q3 = st.columns(3)
+            quotas = {
+                "Easy": q1.number_input("Easy per subject", 0, MAX_PER_STRATUM, 2),
+                "Medium": q2.number_input("Medium per subject", 0, MAX_PER_STRATUM, 2),
+                "Hard": q3.number_input("Hard per subject", 0, MAX_PER_STRATUM, 1),
             }
-            for i in range(len(selected)):
-                st.session_state[f"q_idx_{i}"] = None
-            st.rerun()
+            if st.button("Initialize Assessment"):
+                strata = [(subject, level, n) for subject in subjects for level, n in quotas.items()]
+                try:
+                    spec = new_mixed_paper(bank, title.strip() or "Mixed Paper", strata)
+                    has_questions = bool(paper_questions(spec))
+                except QuestionBankError as exc:
+                    st.error(f"This question set is unavailable right now: {exc}")
+                    has_questions = False
+                if has_questions:
+                    _start_quiz(name, spec)
+                else:
+                    st.warning("Pick at least one subject and a non-zero quota.")
         st.markdown('</div>', unsafe_allow_html=True)
         return
 
@@ -104,73 +222,8 @@ def take_quiz():
     if not quiz["is_completed"]:
         st.markdown(f"### {quiz['topic']} Assessment")
         
-        # 1. Map dynamic colors
-        diff_map = {"Easy": "#00C851", "Medium": "#FFBB33", "Hard": "#FF4444"}
-        diff_accent = diff_map.get(quiz['difficulty'], "#ffffff")
-        
-        # 2. RESPONSIVE COUNTER
-        total_questions = len(quiz["questions"])
-        answered_count = sum(1 for i in range(total_questions) if st.session_state.get(f"q_idx_{i}") is not None)
-        
-        st.markdown(
-            f'<p style="font-size: 1.4rem; font-weight: 700; margin-top: -15px; margin-bottom: 10px; letter-spacing: -0.5px;">'
-            f'<span style="color: {diff_accent};">{quiz["difficulty"]} Mode</span>, '
-            f'<span style="opacity: 0.9;">{answered_count}/{total_questions}</span>'
-            f'</p>', 
-            unsafe_allow_html=True
-        )
-        
-        st.markdown(f"""
-            <style>
-                div[data-testid="stProgress"] > div > div > div > div {{
-                    background-color: {diff_accent} !important;
-                    height: 12px !important;
-                }}
-            </style>
-            """, unsafe_allow_html=True)
-        
-        progress = answered_count / total_questions
-        st.progress(progress)
-        
-        for i, q in enumerate(quiz["questions"]):
-            user_ans = st.session_state.get(f"q_idx_{i}")
-            quiz["answers"][i] = user_ans
-            
-            anim_class = ""
-            if quiz["show_results"]:
-                correct_ans = q.get("correct_answer") or q.get("correct")
-                anim_class = "correct-pulse" if user_ans == correct_ans else "wrong-shake"
-            
-            st.markdown(f'<div class="custom-card {anim_class}">', unsafe_allow_html=True)
-            st.markdown(f"**Question {i+1}**")
-            
-            # Use the global active_accent for radio buttons to avoid red
-            st.markdown(f"""
-                <style>
-                div[role="radiogroup"] > label > div:first-child {{
-                    border-color: {accent_color} !important;
-                }}
-                div[role="radiogroup"] > label > div:first-child > div {{
-                    background-color: {accent_color} !important;
-                }}
-                </style>
-            """, unsafe_allow_html=True)
-
-            st.radio(
-                q["question"], 
-                q["options"], 
-                key=f"q_idx_{i}", 
-                index=None, 
-                disabled=quiz["show_results"]
-            )
-            
-            if quiz["show_results"]:
-                correct_ans = q.get("correct_answer") or q.get("correct")
-                if user_ans == correct_ans:
-                    st.success("Correct!")
-                else:
-                    st.error(f"Incorrect. The right answer was: {correct_ans}")
-            st.markdown('</div>', unsafe_allow_html=True)
+        # Counter and questions rerun together as one fragment when an answer changes
+        _render_quiz_body(quiz)
 
         if not quiz["show_results"]:
             if st.button("Validate Answers"):
@@ -178,8 +231,10 @@ def take_quiz():
                 st.rerun()
         else:
             if st.button("Submit to Hall of Fame"):
-                score = sum(1 for i, q in enumerate(quiz["questions"]) if quiz["answers"].get(i) == (q.get("correct_answer") or q.get("correct")))
-                total = len(quiz["questions"])
+                questions = paper_questions(quiz["paper"])
+                correctness = [ans == q.answer for ans, q in zip(quiz["answers"], questions)]
+                score = sum(correctness)
+                total = len(questions)
                 result = {
                     "student": quiz["student"],
                     "topic": quiz["topic"],
@@ -190,13 +245,17 @@ def take_quiz():
                     "date": datetime.now().strftime("%Y-%m-%d %H:%M"),
                     "time_taken": (datetime.now() - quiz["start_time"]).seconds
                 }
-                st.session_state.quiz_history.append(result)
+                # stored per real topic/difficulty, so a mixed paper's title never becomes a topic
+                parts = paper_results(quiz["paper"], quiz["student"], correctness, result["date"], result["time_taken"])
+                submit_result(parts, quiz["paper"], questions, correctness)
+                quiz["result"] = result
                 quiz["is_completed"] = True
+                st.query_params.pop("paper", None)
                 st.rerun()
     
     # Result Summary
     else:
-        res = st.session_state.quiz_history[-1]
+        res = quiz["result"]
         st.markdown('<div class="custom-card">', unsafe_allow_html=True)
         st.markdown("### Assessment Summary")
         col1, col2, col3 = st.columns(3)
@@ -210,9 +269,7 @@ def take_quiz():
             st.error("Status: Failed")
             
         if st.button("Start New Session"):
-            for key in list(st.session_state.keys()):
-                if key.startswith("q_idx_"):
-                    del st.session_state[key]
+            st.query_params.pop("paper", None)
             st.session_state.current_quiz = None
             st.rerun()
         st.markdown('</div>', unsafe_allow_html=True)
\ No newline at end of file
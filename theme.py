@@ -0,0 +1,194 @@
+import hashlib
+import logging
+import os
+import re
+from functools import lru_cache
+
+log = logging.getLogger(__name__)
+
+# --- 1. Define Professional Palettes ---
+PALETTES = {
+    "Custom": None, 
+    "Default Dark": {"bg": "#0b0e14", "txt": "#ffffff", "card": "#161b22", "accent": "#4f46e5"},
+    "Midnight Blue": {"bg": "#0f172a", "txt": "#f8fafc", "card": "#1e293b", "accent": "#0ea5e9"},
+    "Deep Forest": {"bg": "#061613", "txt": "#e6f4f1", "card": "#0c2d27", "accent": "#059669"},
+    "Cyberpunk": {"bg": "#0d0221", "txt": "#ffffff", "card": "#1a084d", "accent": "#db2777"},
+    "Nordic Light": {"bg": "#f3f4f6", "txt": "#1f2937", "card": "#ffffff", "accent": "#2563eb"},
+    "Slate & Gold": {"bg": "#1e293b", "txt": "#f1f5f9", "card": "#334155", "accent": "#ca8a04"},
+    "Rose Pine": {"bg": "#191724", "txt": "#e0def4", "card": "#1f1d2e", "accent": "#908caa"},
+    "Espresso": {"bg": "#1c1917", "txt": "#fafaf9", "card": "#292524", "accent": "#ea580c"},
+    "Material Dark": {"bg": "#212121", "txt": "#eeffff", "card": "#424242", "accent": "#00acc1"},
+    "Amethyst": {"bg": "#1a103d", "txt": "#f5f3ff", "card": "#2d1b69", "accent": "#7c3aed"},
+}
+
+DIFFICULTY_COLORS = {"Easy": "#00C851", "Medium": "#FFBB33", "Hard": "#FF4444"}
+
+# Plus Jakarta Sans (SIL OFL), served from ./static by Streamlit (see .streamlit/config.toml), no network fetch
+FONT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "fonts", "PlusJakartaSans-Variable.woff2")
+FONT_FACE = """
+@font-face {
+    font-family: 'Plus Jakarta Sans';
+    font-style: normal;
+    font-weight: 400 800;
+    font-display: swap;
+    src: local('Plus Jakarta Sans'), url('app/static/fonts/PlusJakartaSans-Variable.woff2') format('woff2');
+}
+"""
+# Without the file the rule would only earn a 404 per page load, so it is left out (and said so)
+FONT_SERVED = os.path.exists(FONT_FILE)
+if not FONT_SERVED:
+    log.warning("theme: %s is missing, text falls back to sans-serif (see static/fonts/README.txt)", FONT_FILE)
+
+PROGRESS_RULE = """
+.st-key-progress_{level} div[data-testid="stProgress"] > div > div > div > div {{
+    background-color: {color} !important;
+    height: 12px !important;
+}}
+"""
+
+STYLESHEET = """
+/* 1. FORCE GLOBAL THEME */
+.stApp {{
+    background-color: {bg_color} !important;
+    background-image: 
+        radial-gradient(circle at 15% 20%, {accent_color}14 0%, transparent 45%),
+        radial-gradient(circle at 85% 80%, {accent_color}14 0%, transparent 45%) !important;
+    color: {text_color} !important;
+    font-family: 'Plus Jakarta Sans', sans-serif !important;
+}}
+
+/* SIDEBAR DYNAMIC THEME */
+[data-testid="stSidebar"] {{
+    background-color: {bg_color} !important;
+    border-right: 1px solid {accent_color}33 !important;
+}}
+[data-testid="stSidebar"] * {{
+    color: {text_color} !important;
+}}
+/* Style the sidebar title specifically with a gradient */
+[data-testid="stSidebar"] h1 {{
+    background: linear-gradient(90deg, {text_color} 0%, {accent_color} 100%);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    font-weight: 700 !important;
+}}
+
+/* 2. FIX THE BLUE BOX (Welcome Message) */
+div[data-testid="stNotification"] {{
+    background-color: {accent_color}22 !important;
+    color: {text_color} !important;
+    border: 1px solid {accent_color}66 !important;
+    border-radius: 12px !important;
+}}
+div[data-testid="stNotification"] svg {{
+    fill: {accent_color} !important;
+}}
+
+/* 3. FIX TEXTBOX & SELECTBOX CURVATURE */
+div[data-baseweb="input"], 
+div[data-baseweb="select"] > div,
+div[data-baseweb="base-input"] {{
+    border-radius: 12px !important;
+    border: 1px solid {text_color}22 !important;
+    background-color: transparent !important;
+}}
+
+/* Focus state */
+div[data-baseweb="input"]:focus-within, 
+div[data-baseweb="select"]:focus-within,
+div[data-baseweb="base-input"]:focus-within {{
+    border-color: {accent_color} !important;
+    box-shadow: 0 0 0 1px {accent_color} !important;
+    border-radius: 12px !important;
+}}
+
+/* 4. FIX THE DIVIDER */
+.thin-divider {{ 
+    height: 1px !important; 
+    background-color: {text_color} !important;
+    opacity: 0.15 !important;
+    margin: 20px 0 !important;
+    border: none !important;
+}}
+
+/* 5. TABS */
+[data-testid="stTabsTabHighlight"] {{
+    background-color: {accent_color} !important;
+}}
+.stTabs [data-baseweb="tab"]:hover {{ color: {accent_color} !important; }}
+.stTabs [aria-selected="true"] {{ color: {accent_color} !important; }}
+.st-key-active_section div[role="radiogroup"] {{ gap: 24px; }}
+.st-key-active_section div[role="radiogroup"] > label > div:first-child {{ display: none; }}
+.st-key-active_section div[role="radiogroup"] > label {{
+    padding-bottom: 6px;
+    border-bottom: 2px solid transparent;
+    font-weight: 600;
+}}
+.st-key-active_section div[role="radiogroup"] > label:has(input:checked) {{
+    color: {accent_color} !important;
+    border-bottom-color: {accent_color};
+}}
+
+/* 6. BUTTON GLOW EFFECT (Preserved) */
+div.stButton > button, div.stDownloadButton > button {{
+    background: {accent_color} !important;
+    color: white !important;
+    border-radius: 12px !important;
+    font-weight: 700 !important;
+    border: none !important;
+    transition: all 0.3s ease-in-out !important;
+    box-shadow: 0 4px 15px {accent_color}33 !important;
+}}
+
+div.stButton > button:hover, div.stDownloadButton > button:hover {{
+    transform: translateY(-2px) scale(1.02) !important;
+    box-shadow: 0 8px 25px {accent_color}88 !important;
+    filter: brightness(1.1);
+    color: white !important;
+}}
+
+div.stButton > button:active {{
+    transform: scale(0.98);
+}}
+
+/* TITLES */
+.app-title {{
+    background: linear-gradient(90deg, {text_color} 0%, {accent_color} 100%);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    font-size: 48px; font-weight: 800; letter-spacing: -2px;
+}}
+.subtitle {{ color: {sub_text}; margin-bottom: 30px; }}
+/* 7. QUIZ RADIO BUTTONS (accent instead of default red) */
+div[role="radiogroup"] > label > div:first-child {{
+    border-color: {accent_color} !important;
+}}
+div[role="radiogroup"] > label > div:first-child > div {{
+    background-color: {accent_color} !important;
+}}
+
+/* 8. PROGRESS BAR, coloured per difficulty via the keyed container */
+{progress_rules}
+"""
+
+def _minify(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};:,>])\s*", r"\1", css).strip()
+
+@lru_cache(maxsize=256)
+def compile_stylesheet(bg_color, text_color, card_bg, accent_color):
+    """Compiles one colour combination into a minified <style> block, once per process."""
+    progress_rules = "".join(
+        PROGRESS_RULE.format(level=level.lower(), color=color) for level, color in DIFFICULTY_COLORS.items()
+    )
+    css = _minify((FONT_FACE if FONT_SERVED else "") + STYLESHEET.format(
+        bg_color=bg_color,
+        text_color=text_color,
+        card_bg=card_bg,
+        accent_color=accent_color,
+        sub_text=f"{text_color}aa",
+        progress_rules=progress_rules
+    ))
+    digest = hashlib.sha1(css.encode("utf-8")).hexdigest()[:12]
+    return f'<style id="theme-{digest}">{css}</style>'